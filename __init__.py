@@ -76,190 +76,27 @@ Usage:
     fdm_mold = FDMPrintedMoldMaterial(materialId=material.id, nozzleTempForMold=210)
 """
 
-# Core classes
-from polariMaterialsScienceModule.material import Material
-from polariMaterialsScienceModule.materialProperty import MaterialProperty
-from polariMaterialsScienceModule.materialResolution import MaterialResolution
-from polariMaterialsScienceModule.materialPurpose import MaterialPurpose
-from polariMaterialsScienceModule.materialRelatedDevice import MaterialRelatedDevice
+import importlib
 
-# Import from properties module
-from polariMaterialsScienceModule.properties import (
-    # Base category
-    PropertyCategory,
+from polariMaterialsScienceModule._exports import __all__, _LAZY_MAP
 
-    # Category classes
-    RheologicalProperty,
-    MechanicalProperty,
-    SurfaceProperty,
-    ThermalProperty,
 
-    # Rheological properties
-    Viscosity, KrebsViscosity, StormerViscosity,
-    Elasticity, StorageModulus, DMAMeasurement, RheometerMeasurement,
-    MeltFlowIndex, MFIValue, MFIMeasurement,
+def __getattr__(name):
+    """Import and cache a public name on first access."""
+    try:
+        module = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-    # Mechanical properties
-    Hardness, HardnessScale, ShoreMeasurement,
-    TensileStrength, UltimateTensileStrength, TensileMeasurement,
 
-    # Surface properties
-    SolidSurfaceEnergy, CriticalSurfaceTension, ContactAngleMeasurement,
-    LiquidSurfaceTension, SurfaceTensionValue, WilhelmyMeasurement,
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-    # Thermal properties
-    MeltingPoint, MeltingPointValue, DSCMeltingMeasurement,
-    GlassTransition, GlassTransitionTemp, DMAGlassTransitionMeasurement,
-    SmokingPoint, SmokingPointValue, SmokingPointMeasurement,
-    ThermalExpansion, CoefficientOfThermalExpansion, TMAMeasurement,
 
-    # Physical properties
-    SpecificGravity, ReferentialSpecificGravity,
-    PycnometerMeasurement, HydrometerMeasurement, DensityMeterMeasurement
-)
-
-# Import from resolutions module
-from polariMaterialsScienceModule.resolutions import (
-    # Base category
-    ResolutionCategory,
-
-    # Category classes
-    ExperimentalResolution,
-    ContinuumResolution,
-    MesoscaleResolution,
-    AtomisticResolution,
-    QuantumResolution,
-
-    # Experimental (Level 0)
-    RawExperimentalMaterial,
-    RulesOfMixturesExperimentalMaterial,
-
-    # Continuum (Level 1)
-    ConsistentFiniteElementMaterial,
-    StochasticFiniteElementMaterial,
-    ChosenMaterial,
-    RangeMaterial,
-
-    # Mesoscale (Level 2)
-    CoarsegrainedMolecularDynamicsMaterial,
-
-    # Atomistic (Level 3)
-    MolecularDynamicsMaterial,
-
-    # Quantum (Level 4)
-    DensityFunctionalMaterial
-)
-
-# Import from purposes module
-from polariMaterialsScienceModule.purposes import (
-    # Base category
-    PurposeCategory,
-
-    # Base conditions
-    CNCMachinable,
-    ThreeDimensionalPrintable,
-
-    # Mold Fabrication category
-    MoldFabricationPurpose,
-
-    # 3D Printed Molds
-    ThreeDimensionalPrintedMoldMaterial,
-    FDMPrintedMoldMaterial,
-    SLAPrintedMoldMaterial,
-    SLSPrintedMoldMaterial,
-
-    # CNC Machined Molds
-    CNCMachinedMoldMaterial,
-    MilledMoldMaterial,
-    TurnedMoldMaterial,
-
-    # Geopolymer Concrete Molds
-    GeopolymerConcreteMoldMaterial,
-    GeopolymerThermalResistantConcreteMoldMaterial
-)
-
-# Import from devices module
-from polariMaterialsScienceModule.devices import (
-    # Base category
-    DeviceCategory,
-
-    # 3D Printing Devices
-    ThreeDimensionalPrintingDevice,
-    FDMPrinter,
-    SLAPrinter,
-    SLSPrinter,
-
-    # CNC Mills
-    CNCMill,
-    ThreeAxisMill,
-    FiveAxisMill,
-
-    # CNC Lathes
-    CNCLathe,
-
-    # Material Testing Devices
-    MaterialTestingDevice,
-    Viscometer,
-    HardnessTester,
-    TensileTestingMachine,
-    ThermalAnalyzer
-)
-
-# Import from referenceMaterials module
-from polariMaterialsScienceModule.referenceMaterials import (
-    ReferenceMaterial,
-    PropertyValueSource,
-
-    # 3D Printable reference materials
-    PrintableReferenceMaterial,
-    PLA, ABS, PETG, Nylon, TPU, PHA
-)
-
-# Import from rawMaterials module
-from polariMaterialsScienceModule.rawMaterials import (
-    RawMaterial
-)
-
-# Import from materialSourcing module
-from polariMaterialsScienceModule.materialSourcing import (
-    MaterialSourcing,
-    NaturalSourcing,
-    OpenSourceLocalSourcing,
-    CommercialSourcing
-)
-
-# Import from dataProvenance module
-from polariMaterialsScienceModule.dataProvenance import (
-    DataProvenance,
-    DataSource
-)
-
-# Import from materialAdditives module
-from polariMaterialsScienceModule.materialAdditives import (
-    MaterialAdditive,
-    PropertyEffect,
-    AdditiveCompatibility,
-    Compatibilizer
-)
-
-# Import from targetProfiles module
-from polariMaterialsScienceModule.targetProfiles import (
-    TargetMaterialProfile,
-    PropertyTarget
-)
-
-# Import from formulation module
-from polariMaterialsScienceModule.formulation import (
-    Formulation,
-    FormulationComponent,
-    FormulationIntent
-)
-
-from polariMaterialsScienceModule.registerMaterialsScienceModule import register_materials_science_defaults
-from polariMaterialsScienceModule.seedData import seed_initial_data
-
-
-def initialize(manager=None, include_seed_data=False):
+def initialize(manager=None, include_seed_data=False, force=False):
     """
     Initialize the Materials Science module.
 
@@ -271,6 +108,8 @@ def initialize(manager=None, include_seed_data=False):
         manager: The object tree manager to register with.
         include_seed_data: If True, also load initial data from
             the initialData/ JSON files into the object tree.
+        force: If True, re-register the classes even if this manager
+            was already initialized.
 
     Returns:
         dict: {
@@ -278,169 +117,13 @@ def initialize(manager=None, include_seed_data=False):
             'seed_data': dict of class name -> [instances] (if include_seed_data)
         }
     """
+    from polariMaterialsScienceModule.registerMaterialsScienceModule import register_materials_science_defaults
+    from polariMaterialsScienceModule.seedData import seed_initial_data
+
     result = {
-        'registered_classes': register_materials_science_defaults(manager),
+        'registered_classes': register_materials_science_defaults(manager, force=force),
         'seed_data': {}
     }
     if include_seed_data:
         result['seed_data'] = seed_initial_data(manager)
     return result
-
-__all__ = [
-    # Core classes
-    'Material',
-    'MaterialProperty',
-    'MaterialResolution',
-    'MaterialPurpose',
-    'MaterialRelatedDevice',
-
-    # Property categories
-    'PropertyCategory',
-    'RheologicalProperty',
-    'MechanicalProperty',
-    'SurfaceProperty',
-    'ThermalProperty',
-
-    # Rheological properties
-    'Viscosity', 'KrebsViscosity', 'StormerViscosity',
-    'Elasticity', 'StorageModulus', 'DMAMeasurement', 'RheometerMeasurement',
-    'MeltFlowIndex', 'MFIValue', 'MFIMeasurement',
-
-    # Mechanical properties
-    'Hardness', 'HardnessScale', 'ShoreMeasurement',
-    'TensileStrength', 'UltimateTensileStrength', 'TensileMeasurement',
-
-    # Surface properties
-    'SolidSurfaceEnergy', 'CriticalSurfaceTension', 'ContactAngleMeasurement',
-    'LiquidSurfaceTension', 'SurfaceTensionValue', 'WilhelmyMeasurement',
-
-    # Thermal properties
-    'MeltingPoint', 'MeltingPointValue', 'DSCMeltingMeasurement',
-    'GlassTransition', 'GlassTransitionTemp', 'DMAGlassTransitionMeasurement',
-    'SmokingPoint', 'SmokingPointValue', 'SmokingPointMeasurement',
-    'ThermalExpansion', 'CoefficientOfThermalExpansion', 'TMAMeasurement',
-
-    # Physical properties
-    'SpecificGravity', 'ReferentialSpecificGravity',
-    'PycnometerMeasurement', 'HydrometerMeasurement', 'DensityMeterMeasurement',
-
-    # Resolution categories
-    'ResolutionCategory',
-    'ExperimentalResolution',
-    'ContinuumResolution',
-    'MesoscaleResolution',
-    'AtomisticResolution',
-    'QuantumResolution',
-
-    # Experimental resolutions (Level 0)
-    'RawExperimentalMaterial',
-    'RulesOfMixturesExperimentalMaterial',
-
-    # Continuum resolutions (Level 1)
-    'ConsistentFiniteElementMaterial',
-    'StochasticFiniteElementMaterial',
-    'ChosenMaterial',
-    'RangeMaterial',
-
-    # Mesoscale resolutions (Level 2)
-    'CoarsegrainedMolecularDynamicsMaterial',
-
-    # Atomistic resolutions (Level 3)
-    'MolecularDynamicsMaterial',
-
-    # Quantum resolutions (Level 4)
-    'DensityFunctionalMaterial',
-
-    # Purpose categories
-    'PurposeCategory',
-
-    # Base conditions
-    'CNCMachinable',
-    'ThreeDimensionalPrintable',
-
-    # Mold Fabrication
-    'MoldFabricationPurpose',
-
-    # 3D Printed Mold purposes
-    'ThreeDimensionalPrintedMoldMaterial',
-    'FDMPrintedMoldMaterial',
-    'SLAPrintedMoldMaterial',
-    'SLSPrintedMoldMaterial',
-
-    # CNC Machined Mold purposes
-    'CNCMachinedMoldMaterial',
-    'MilledMoldMaterial',
-    'TurnedMoldMaterial',
-
-    # Geopolymer Concrete Mold purposes
-    'GeopolymerConcreteMoldMaterial',
-    'GeopolymerThermalResistantConcreteMoldMaterial',
-
-    # Device categories
-    'DeviceCategory',
-
-    # 3D Printing Devices
-    'ThreeDimensionalPrintingDevice',
-    'FDMPrinter',
-    'SLAPrinter',
-    'SLSPrinter',
-
-    # CNC Mills
-    'CNCMill',
-    'ThreeAxisMill',
-    'FiveAxisMill',
-
-    # CNC Lathes
-    'CNCLathe',
-
-    # Material Testing Devices
-    'MaterialTestingDevice',
-    'Viscometer',
-    'HardnessTester',
-    'TensileTestingMachine',
-    'ThermalAnalyzer',
-
-    # Reference Materials
-    'ReferenceMaterial',
-    'PropertyValueSource',
-    'PrintableReferenceMaterial',
-    'PLA',
-    'ABS',
-    'PETG',
-    'Nylon',
-    'TPU',
-    'PHA',
-
-    # Raw Materials
-    'RawMaterial',
-
-    # Material Sourcing
-    'MaterialSourcing',
-    'NaturalSourcing',
-    'OpenSourceLocalSourcing',
-    'CommercialSourcing',
-
-    # Data Provenance
-    'DataProvenance',
-    'DataSource',
-
-    # Material Additives
-    'MaterialAdditive',
-    'PropertyEffect',
-    'AdditiveCompatibility',
-    'Compatibilizer',
-
-    # Target Profiles
-    'TargetMaterialProfile',
-    'PropertyTarget',
-
-    # Formulation
-    'Formulation',
-    'FormulationComponent',
-    'FormulationIntent',
-
-    # Module initialization
-    'initialize',
-    'register_materials_science_defaults',
-    'seed_initial_data'
-]
@@ -0,0 +1,228 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Package Exports
+
+Export tables for the polariMaterialsScienceModule package: the public
+name -> defining module map used by the package's lazy __getattr__, and
+the package __all__. Both are immutable module constants so they are
+built once, when this module is first imported.
+"""
+
+# Public names are resolved on first attribute access (PEP 562) so that
+# importing the package only loads the submodules a caller actually uses.
+# Each entry maps the module that defines a group of names to those names.
+_LAZY_EXPORTS = (
+    # Core classes
+    ('polariMaterialsScienceModule.material', ('Material',)),
+    ('polariMaterialsScienceModule.materialProperty', ('MaterialProperty',)),
+    ('polariMaterialsScienceModule.materialResolution', ('MaterialResolution',)),
+    ('polariMaterialsScienceModule.materialPurpose', ('MaterialPurpose',)),
+    ('polariMaterialsScienceModule.materialRelatedDevice', ('MaterialRelatedDevice',)),
+
+    # Properties
+    ('polariMaterialsScienceModule.properties', (
+        # Base category
+        'PropertyCategory',
+
+        # Category classes
+        'RheologicalProperty',
+        'MechanicalProperty',
+        'SurfaceProperty',
+        'ThermalProperty',
+
+        # Rheological properties
+        'Viscosity', 'KrebsViscosity', 'StormerViscosity',
+        'Elasticity', 'StorageModulus', 'DMAMeasurement', 'RheometerMeasurement',
+        'MeltFlowIndex', 'MFIValue', 'MFIMeasurement',
+
+        # Mechanical properties
+        'Hardness', 'HardnessScale', 'ShoreMeasurement',
+        'TensileStrength', 'UltimateTensileStrength', 'TensileMeasurement',
+
+        # Surface properties
+        'SolidSurfaceEnergy', 'CriticalSurfaceTension', 'ContactAngleMeasurement',
+        'LiquidSurfaceTension', 'SurfaceTensionValue', 'WilhelmyMeasurement',
+
+        # Thermal properties
+        'MeltingPoint', 'MeltingPointValue', 'DSCMeltingMeasurement',
+        'GlassTransition', 'GlassTransitionTemp', 'DMAGlassTransitionMeasurement',
+        'SmokingPoint', 'SmokingPointValue', 'SmokingPointMeasurement',
+        'ThermalExpansion', 'CoefficientOfThermalExpansion', 'TMAMeasurement',
+
+        # Physical properties
+        'SpecificGravity', 'ReferentialSpecificGravity',
+        'PycnometerMeasurement', 'HydrometerMeasurement', 'DensityMeterMeasurement',
+    )),
+
+    # Resolutions
+    ('polariMaterialsScienceModule.resolutions', (
+        # Base category
+        'ResolutionCategory',
+
+        # Category classes
+        'ExperimentalResolution',
+        'ContinuumResolution',
+        'MesoscaleResolution',
+        'AtomisticResolution',
+        'QuantumResolution',
+
+        # Experimental (Level 0)
+        'RawExperimentalMaterial',
+        'RulesOfMixturesExperimentalMaterial',
+
+        # Continuum (Level 1)
+        'ConsistentFiniteElementMaterial',
+        'StochasticFiniteElementMaterial',
+        'ChosenMaterial',
+        'RangeMaterial',
+
+        # Mesoscale (Level 2)
+        'CoarsegrainedMolecularDynamicsMaterial',
+
+        # Atomistic (Level 3)
+        'MolecularDynamicsMaterial',
+
+        # Quantum (Level 4)
+        'DensityFunctionalMaterial',
+    )),
+
+    # Purposes
+    ('polariMaterialsScienceModule.purposes', (
+        # Base category
+        'PurposeCategory',
+
+        # Base conditions
+        'CNCMachinable',
+        'ThreeDimensionalPrintable',
+
+        # Mold Fabrication category
+        'MoldFabricationPurpose',
+
+        # 3D Printed Molds
+        'ThreeDimensionalPrintedMoldMaterial',
+        'FDMPrintedMoldMaterial',
+        'SLAPrintedMoldMaterial',
+        'SLSPrintedMoldMaterial',
+
+        # CNC Machined Molds
+        'CNCMachinedMoldMaterial',
+        'MilledMoldMaterial',
+        'TurnedMoldMaterial',
+
+        # Geopolymer Concrete Molds
+        'GeopolymerConcreteMoldMaterial',
+        'GeopolymerThermalResistantConcreteMoldMaterial',
+    )),
+
+    # Devices
+    ('polariMaterialsScienceModule.devices', (
+        # Base category
+        'DeviceCategory',
+        'DeviceCatalog',
+
+        # 3D Printing Devices
+        'ThreeDimensionalPrintingDevice',
+        'PrinterFeature',
+        'FDMPrinter',
+        'SLAPrinter',
+        'SLSPrinter',
+
+        # CNC Mills
+        'CNCMill',
+        'MillFeature',
+        'ThreeAxisMill',
+        'FiveAxisMill',
+
+        # CNC Lathes
+        'CNCLathe',
+
+        # Material Testing Devices
+        'MaterialTestingDevice',
+        'TestingFeature',
+        'Viscometer',
+        'HardnessTester',
+        'TensileTestingMachine',
+        'TestingMode',
+        'ThermalAnalyzer',
+    )),
+
+    # Reference materials
+    ('polariMaterialsScienceModule.referenceMaterials', (
+        'ReferenceMaterial',
+        'PropertyValueSource',
+
+        # 3D Printable reference materials
+        'PrintableReferenceMaterial',
+        'PLA', 'ABS', 'PETG', 'Nylon', 'TPU', 'PHA',
+    )),
+
+    # Raw materials
+    ('polariMaterialsScienceModule.rawMaterials', ('RawMaterial',)),
+
+    # Material sourcing
+    ('polariMaterialsScienceModule.materialSourcing', (
+        'MaterialSourcing',
+        'NaturalSourcing',
+        'OpenSourceLocalSourcing',
+        'CommercialSourcing',
+        'FrozenCommercialSourcing',
+        'SourcingFeature',
+        'CommercialSourcingTable',
+    )),
+
+    # Data provenance
+    ('polariMaterialsScienceModule.dataProvenance', (
+        'DataProvenance',
+        'DataSource',
+    )),
+
+    # Material additives
+    ('polariMaterialsScienceModule.materialAdditives', (
+        'MaterialAdditive',
+        'PropertyEffect',
+        'PropertyEffectTable',
+        'AdditiveCompatibility',
+        'AdditiveCompatibilityIndex',
+        'Compatibilizer',
+    )),
+
+    # Target profiles
+    ('polariMaterialsScienceModule.targetProfiles', (
+        'TargetMaterialProfile',
+        'PropertyTarget',
+    )),
+
+    # Formulation
+    ('polariMaterialsScienceModule.formulation', (
+        'Formulation',
+        'FormulationComponent',
+        'FormulationIntent',
+        'FormulationComponentTable',
+        'ComponentRole',
+        'FormulationIndex',
+    )),
+
+    # Module initialization
+    ('polariMaterialsScienceModule.registerMaterialsScienceModule', ('register_materials_science_defaults',)),
+    ('polariMaterialsScienceModule.seedData', ('seed_initial_data',)),
+)
+
+_LAZY_MAP = {name: module for module, names in _LAZY_EXPORTS for name in names}
+
+# initialize is defined in the package __init__ itself; every other public
+# name comes from the lazy export table, so the two cannot drift apart.
+__all__ = ('initialize', *_LAZY_MAP)
@@ -0,0 +1,133 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Columnar Kernels
+
+Numeric kernels used by ColumnarTable filters and formulation sweeps
+when numpy is installed. If numba is also installed, the kernels are
+JIT-compiled (cached on disk after the first run) and fuse their checks
+into a single parallel pass. Otherwise they fall back to plain numpy
+expressions.
+"""
+
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _and_range_jit(mask, values, low, high):
+        for i in numba.prange(values.shape[0]):
+            if mask[i]:
+                value = values[i]
+                mask[i] = value >= low and value <= high
+
+    @numba.njit(parallel=True, cache=True)
+    def _blend_candidates_jit(weights, maxLoads, compatible, effects, predicted, feasible):
+        nAdditives = weights.shape[1]
+        nProperties = effects.shape[1]
+        for c in numba.prange(weights.shape[0]):
+            total = 0.0
+            ok = True
+            for a in range(nAdditives):
+                weight = weights[c, a]
+                total += weight
+                if weight > 0.0 and (not compatible[a]
+                                     or (maxLoads[a] > 0.0 and weight > maxLoads[a])):
+                    ok = False
+            feasible[c] = ok and total <= 100.0
+            for p in range(nProperties):
+                blended = 0.0
+                for a in range(nAdditives):
+                    blended += weights[c, a] * effects[a, p]
+                predicted[c, p] = blended
+
+else:
+    _and_range_jit = None
+    _blend_candidates_jit = None
+
+
+def and_range(mask, values, low, high):
+    """
+    AND an inclusive range test on values into mask, in place.
+
+    Args:
+        mask: numpy bool array, updated in place
+        values: numpy numeric array of the same length
+        low: Lower bound, or None for no lower bound
+        high: Upper bound, or None for no upper bound
+    """
+    if _and_range_jit is not None:
+        _and_range_jit(mask, values,
+                       -math.inf if low is None else float(low),
+                       math.inf if high is None else float(high))
+        return
+    if low is not None:
+        mask &= values >= low
+    if high is not None:
+        mask &= values <= high
+
+
+def blend_candidates(weights, maxLoads, compatible, effects):
+    """
+    Score a batch of candidate additive mixes in one pass.
+
+    Candidates are rows of additive weight percents. A candidate is
+    feasible when its weights sum to at most 100, no additive exceeds its
+    maximum loading, and only compatible additives have nonzero weight.
+    Its predicted property changes are weights @ effects.
+
+    Args:
+        weights: (candidates x additives) weight percents
+        maxLoads: (additives,) maximum loading percent; 0 means no limit
+        compatible: (additives,) bools, whether each additive is
+            compatible with the base material
+        effects: (additives x properties) effect per weight percent, e.g.
+            gathered from a PropertyEffectTable
+
+    Returns:
+        tuple: (predicted, feasible) - a (candidates x properties) float64
+            array and a (candidates,) bool array. Requires numpy.
+    """
+    if numpy is None:
+        raise ImportError("blend_candidates() requires numpy")
+    weights = numpy.ascontiguousarray(weights, dtype='d')
+    maxLoads = numpy.ascontiguousarray(maxLoads, dtype='d')
+    compatible = numpy.ascontiguousarray(compatible, dtype=bool)
+    effects = numpy.ascontiguousarray(effects, dtype='d')
+    if _blend_candidates_jit is not None:
+        predicted = numpy.empty((weights.shape[0], effects.shape[1]))
+        feasible = numpy.empty(weights.shape[0], dtype=bool)
+        _blend_candidates_jit(weights, maxLoads, compatible, effects, predicted, feasible)
+        return predicted, feasible
+    used = weights > 0.0
+    overloaded = (maxLoads > 0.0) & (weights > maxLoads)
+    feasible = (
+        (weights.sum(axis=1) <= 100.0)
+        & ~(used & ~compatible).any(axis=1)
+        & ~(used & overloaded).any(axis=1)
+    )
+    return weights @ effects, feasible
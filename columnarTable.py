@@ -0,0 +1,233 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Columnar Table
+
+Column-oriented (structure-of-arrays) storage for flat records. Numeric
+fields are kept in contiguous array.array columns so bulk filters scan
+packed values instead of loading attributes object by object; string and
+other fields are kept in plain list columns.
+
+NumPy is optional. When it is installed, numeric columns are exposed as
+zero-copy ndarray views and range filters run as vectorized masks
+(JIT-compiled with numba when that is installed, see columnarKernels).
+"""
+
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Values written to numeric columns are coerced with these, so integer
+# columns accept whole floats and unset ('' or None) values store as 0.
+_CONVERTERS = dict.fromkeys('bBhHiIlLqQ', int)
+_CONVERTERS.update(dict.fromkeys('fd', float))
+
+
+def _to_float32(value):
+    """Round a bound to float32 so it compares consistently with stored 'f' values."""
+    return None if value is None else array('f', (value,))[0]
+
+if numpy is not None:
+    from polariMaterialsScienceModule.columnarKernels import and_range
+
+
+class ColumnarTable:
+    """
+    Column-oriented table of flat records.
+
+    Attributes:
+        fields: Tuple of (name, typecode) pairs. typecode is an array
+            module typecode for numeric columns ('f' float32, 'd' float64,
+            'B'/'I' unsigned ints, 'b'/'i'/'q' signed ints, ...), or None
+            for object columns stored as lists
+        columns: Mapping of field name -> array.array or list
+        converters: Mapping of field name -> int/float coercion for numeric
+            columns (None for object columns)
+        rowCount: Number of rows currently stored
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.columns = {
+            name: array(typecode) if typecode else []
+            for name, typecode in self.fields
+        }
+        self.converters = {
+            name: _CONVERTERS[typecode] if typecode else None
+            for name, typecode in self.fields
+        }
+        self._columnSpecs = tuple(
+            (name, self.columns[name], self.converters[name])
+            for name, _ in self.fields
+        )
+        self.rowCount = 0
+
+    def __len__(self):
+        return self.rowCount
+
+    def append(self, record):
+        """
+        Append one record (a mapping of field name -> value).
+
+        Missing fields are stored as 0 in numeric columns and None in
+        object columns. Returns the new row index.
+        """
+        return self._append_row([record.get(name) for name, _, _ in self._columnSpecs])
+
+    def append_object(self, obj):
+        """Append one row read from the attributes of obj. Returns the row index."""
+        return self._append_row([getattr(obj, name, None) for name, _, _ in self._columnSpecs])
+
+    def _append_row(self, values):
+        # Either every column gains the row or none does: a value that
+        # fails to convert or does not fit its column's typecode rolls back
+        # the columns already appended, so the columns stay aligned.
+        appended = []
+        try:
+            for (name, column, convert), value in zip(self._columnSpecs, values):
+                column.append(convert(value or 0) if convert else value)
+                appended.append(column)
+        except (OverflowError, TypeError, ValueError) as exc:
+            for column in appended:
+                column.pop()
+            raise ValueError(f"Column '{name}' cannot store {value!r}: {exc}") from exc
+        self.rowCount += 1
+        return self.rowCount - 1
+
+    def extend(self, records):
+        """Append many records (mappings). Returns the number appended."""
+        count = 0
+        for record in records:
+            self.append(record)
+            count += 1
+        return count
+
+    def set_row(self, index, record):
+        """
+        Overwrite the fields present in record for an existing row.
+
+        The update is all-or-nothing: if any value cannot be stored, the
+        fields already written are restored and ValueError is raised.
+        """
+        if not 0 <= index < self.rowCount:
+            raise IndexError(f"row {index} out of range for {self.rowCount} rows")
+        columns = self.columns
+        unknown = record.keys() - columns.keys()
+        if unknown:
+            raise KeyError(f"unknown columns {sorted(unknown)}")
+        previous = []
+        try:
+            for name, value in record.items():
+                convert = self.converters[name]
+                column = columns[name]
+                old = column[index]
+                column[index] = convert(value or 0) if convert else value
+                previous.append((column, old))
+        except (OverflowError, TypeError, ValueError) as exc:
+            for column, old in previous:
+                column[index] = old
+            raise ValueError(f"Column '{name}' cannot store {value!r}: {exc}") from exc
+
+    def row(self, index):
+        """Return row index as a dict of field name -> value."""
+        return {name: self.columns[name][index] for name, _ in self.fields}
+
+    def column(self, name):
+        """
+        Return a column for bulk reads.
+
+        Numeric columns are returned as a zero-copy numpy view when numpy
+        is available; otherwise the underlying array.array or list.
+        """
+        values = self.columns[name]
+        if numpy is not None and isinstance(values, array):
+            if not values:
+                return numpy.empty(0, dtype=values.typecode)
+            return numpy.frombuffer(values, dtype=values.typecode)
+        return values
+
+    def to_structured_array(self):
+        """
+        Copy the table into a numpy structured array (one record per row).
+
+        Numeric columns keep their typecode's dtype; list columns become
+        object fields. Requires numpy.
+        """
+        if numpy is None:
+            raise ImportError("to_structured_array() requires numpy")
+        dtype = numpy.dtype([
+            (name, typecode if typecode else object)
+            for name, typecode in self.fields
+        ])
+        records = numpy.empty(self.rowCount, dtype=dtype)
+        for name, _ in self.fields:
+            records[name] = self.column(name)
+        return records
+
+    def where(self, **criteria):
+        """
+        Return the row indices matching every criterion.
+
+        Each keyword names a column. A (low, high) tuple is an inclusive
+        range where either bound may be None; any other value must match
+        exactly.
+
+        Example:
+            table.where(swingOverBed=(300.0, None), chuckType='3-jaw')
+        """
+        for name, criterion in criteria.items():
+            if isinstance(criterion, tuple) and getattr(self.columns[name], 'typecode', None) == 'f':
+                criteria[name] = (_to_float32(criterion[0]), _to_float32(criterion[1]))
+        if numpy is not None:
+            return self._where_numpy(criteria)
+        rows = range(self.rowCount)
+        for name, criterion in criteria.items():
+            values = self.columns[name]
+            if isinstance(criterion, tuple):
+                low, high = criterion
+                rows = [
+                    i for i in rows
+                    if (low is None or values[i] >= low)
+                    and (high is None or values[i] <= high)
+                ]
+            else:
+                rows = [i for i in rows if values[i] == criterion]
+        return list(rows)
+
+    def where_flags(self, name, flags):
+        """Return the row indices whose integer column name has every bit in flags set."""
+        values = self.column(name)
+        if numpy is not None:
+            return numpy.flatnonzero((values & flags) == flags).tolist()
+        return [i for i, value in enumerate(values) if value & flags == flags]
+
+    def _where_numpy(self, criteria):
+        mask = numpy.ones(self.rowCount, dtype=bool)
+        for name, criterion in criteria.items():
+            values = self.column(name)
+            if isinstance(criterion, tuple):
+                and_range(mask, values, *criterion)
+            elif isinstance(self.columns[name], array):
+                mask &= values == criterion
+            else:
+                mask &= numpy.fromiter(
+                    (value == criterion for value in values),
+                    dtype=bool, count=self.rowCount,
+                )
+        return numpy.flatnonzero(mask).tolist()
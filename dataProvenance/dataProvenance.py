@@ -21,6 +21,7 @@ Tracks version, credibility level, and links to individual data sources.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import split_csv, intern_value
 
 
 class DataProvenance(treeObject):
@@ -32,6 +33,8 @@ class DataProvenance(treeObject):
         credibilityLevel: Overall credibility (verified, peer_reviewed,
             manufacturer_stated, community_consensus, unverified)
         sourceIds: Comma-separated list of DataSource IDs backing this record
+            (a sequence of IDs is also accepted and stored in this form;
+            an ID containing ',' raises ValueError)
         notes: Additional notes about data credibility
     """
 
@@ -46,9 +49,50 @@ class DataProvenance(treeObject):
                  notes=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
         self.version = version
-        self.credibilityLevel = credibilityLevel
+        self.credibilityLevel = intern_value(credibilityLevel)
+        if not isinstance(sourceIds, str):
+            sourceIds = tuple(sourceIds)
+            for sourceId in sourceIds:
+                if ',' in sourceId:
+                    raise ValueError(
+                        f"DataSource ID {sourceId!r} contains ',' and cannot be stored in sourceIds")
+            sourceIds = ','.join(sourceIds)
         self.sourceIds = sourceIds
         self.notes = notes
 
+    @property
+    def sourceIdList(self):
+        """Tuple of the DataSource IDs listed in sourceIds."""
+        return split_csv(self.sourceIds)
+
+    @classmethod
+    def resolve_sources(cls, provenances, sources):
+        """
+        Resolve the DataSource objects referenced by many provenance records.
+
+        Builds a single id -> DataSource index and answers every lookup
+        from it, rather than resolving each referenced ID separately.
+
+        Args:
+            provenances: Iterable of DataProvenance instances.
+            sources: Mapping of DataSource ID -> DataSource, or an
+                iterable of DataSource instances.
+
+        Returns:
+            dict: Provenance ID -> list of DataSource objects, in the order
+                listed in sourceIds. IDs with no matching source are skipped.
+        """
+        if hasattr(sources, 'get'):
+            by_id = sources
+        else:
+            by_id = {source.id: source for source in sources}
+        resolved = {}
+        for provenance in provenances:
+            resolved[provenance.id] = [
+                by_id[source_id] for source_id in provenance.sourceIdList
+                if source_id in by_id
+            ]
+        return resolved
+
     def __repr__(self):
         return f"DataProvenance(id='{self.id}', credibility='{self.credibilityLevel}')"
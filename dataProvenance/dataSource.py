@@ -20,7 +20,10 @@ Individual citation/source record for provenance tracking.
 Represents a single source of information (paper, datasheet, etc.)
 """
 
+import weakref
+
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class DataSource(treeObject):
@@ -38,6 +41,11 @@ class DataSource(treeObject):
         notes: Additional notes about this source
     """
 
+    # Live shared instances keyed by (manager, sourceReference, sourceName,
+    # sourceDate), used by get_or_create(). Held weakly so unused sources
+    # can be freed.
+    _sharedSources = weakref.WeakValueDictionary()
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -50,12 +58,49 @@ class DataSource(treeObject):
                  sourceDate='',
                  notes=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.sourceType = sourceType
+        self.sourceType = intern_value(sourceType)
         self.sourceName = sourceName
         self.sourceReference = sourceReference
         self.sourceAuthor = sourceAuthor
         self.sourceDate = sourceDate
         self.notes = notes
 
+    @classmethod
+    def get_or_create(cls, manager=None, **fields):
+        """
+        Return a shared DataSource for a citation, creating it if needed.
+
+        Sources in the same manager's tree with the same sourceReference,
+        sourceName and sourceDate resolve to one instance while it is alive,
+        so many records citing the same datasheet or paper share a single
+        DataSource. A live source with that citation is reused only if it
+        matches every given field (sourceType, sourceAuthor, notes, id, ...);
+        otherwise a new, unshared source is constructed. A call with none of
+        the three citation fields has nothing to match on, so it always
+        constructs a new source. Use the constructor instead when a specific
+        id must be kept.
+
+        Args:
+            manager: The object tree manager for a newly created source.
+            **fields: DataSource constructor fields.
+
+        Returns:
+            DataSource: The existing or newly created source.
+        """
+        citation = (fields.get('sourceReference', ''),
+                    fields.get('sourceName', ''),
+                    fields.get('sourceDate', ''))
+        if not any(citation):
+            return cls(manager=manager, **fields)
+        key = (manager,) + citation
+        source = cls._sharedSources.get(key)
+        if source is not None and all(
+                getattr(source, name) == value for name, value in fields.items()):
+            return source
+        source = cls(manager=manager, **fields)
+        if key not in cls._sharedSources:
+            cls._sharedSources[key] = source
+        return source
+
     def __repr__(self):
         return f"DataSource(id='{self.id}', type='{self.sourceType}', name='{self.sourceName}')"
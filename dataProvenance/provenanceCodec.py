@@ -0,0 +1,142 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Provenance Codec
+
+Compact binary encoding for batches of DataProvenance and DataSource
+records, for persistence or transport where JSON is too bulky.
+
+Layout (little-endian):
+    uint32 record count, then per record:
+    uint8 vocabulary code (credibilityLevel or sourceType); 0xFF means
+        the label is not in the known vocabulary and follows as a string
+    each string field as uint32 byte length + UTF-8 bytes
+
+Batches are written into a single preallocated bytearray sized by a
+first pass over the encoded fields. Loading returns plain record dicts
+whose keys match the model __init__ kwargs, the same shape as the
+initialData JSON files.
+"""
+
+import struct
+
+# Code tables are part of the on-disk format: only ever append to them.
+CREDIBILITY_CODES = (
+    'verified',
+    'peer_reviewed',
+    'manufacturer_stated',
+    'community_consensus',
+    'unverified',
+)
+
+SOURCE_TYPE_CODES = (
+    'llm_generated',
+    'research_paper',
+    'manufacturer_datasheet',
+    'experimental_testing',
+    'community_measurement',
+    'personal_observation',
+)
+
+_CUSTOM_CODE = 0xFF
+
+_COUNT = struct.Struct('<I')
+_CODE = struct.Struct('<B')
+_LENGTH = struct.Struct('<I')
+
+_PROVENANCE_FIELDS = ('id', 'version', 'sourceIds', 'notes')
+_SOURCE_FIELDS = ('id', 'sourceName', 'sourceReference', 'sourceAuthor', 'sourceDate', 'notes')
+
+_CREDIBILITY_INDEX = {label: code for code, label in enumerate(CREDIBILITY_CODES)}
+_SOURCE_TYPE_INDEX = {label: code for code, label in enumerate(SOURCE_TYPE_CODES)}
+
+
+def dump_provenances(provenances):
+    """Encode DataProvenance objects into a bytearray."""
+    return _dump(provenances, 'credibilityLevel', _CREDIBILITY_INDEX, _PROVENANCE_FIELDS)
+
+
+def load_provenances(buffer):
+    """Decode a buffer from dump_provenances() into a list of record dicts."""
+    return _load(buffer, 'credibilityLevel', CREDIBILITY_CODES, _PROVENANCE_FIELDS)
+
+
+def dump_sources(sources):
+    """Encode DataSource objects into a bytearray."""
+    return _dump(sources, 'sourceType', _SOURCE_TYPE_INDEX, _SOURCE_FIELDS)
+
+
+def load_sources(buffer):
+    """Decode a buffer from dump_sources() into a list of record dicts."""
+    return _load(buffer, 'sourceType', SOURCE_TYPE_CODES, _SOURCE_FIELDS)
+
+
+def _encode(obj, codeField, index, fields):
+    # Unset (None) labels and fields are written as empty strings.
+    label = getattr(obj, codeField) or ''
+    code = index.get(label, _CUSTOM_CODE)
+    strings = [(getattr(obj, field) or '').encode('utf-8') for field in fields]
+    if code == _CUSTOM_CODE:
+        strings.insert(0, label.encode('utf-8'))
+    return code, strings
+
+
+def _dump(objects, codeField, index, fields):
+    encoded = [_encode(obj, codeField, index, fields) for obj in objects]
+
+    size = _COUNT.size
+    for _, strings in encoded:
+        size += _CODE.size + _LENGTH.size * len(strings) + sum(map(len, strings))
+
+    buffer = bytearray(size)
+    _COUNT.pack_into(buffer, 0, len(encoded))
+    offset = _COUNT.size
+    for code, strings in encoded:
+        _CODE.pack_into(buffer, offset, code)
+        offset += _CODE.size
+        for data in strings:
+            _LENGTH.pack_into(buffer, offset, len(data))
+            offset += _LENGTH.size
+            buffer[offset:offset + len(data)] = data
+            offset += len(data)
+    return buffer
+
+
+def _read_string(view, offset):
+    (length,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    return str(view[offset:offset + length], 'utf-8'), offset + length
+
+
+def _load(buffer, codeField, labels, fields):
+    view = memoryview(buffer)
+    (count,) = _COUNT.unpack_from(view, 0)
+    offset = _COUNT.size
+    records = []
+    for _ in range(count):
+        (code,) = _CODE.unpack_from(view, offset)
+        offset += _CODE.size
+        if code == _CUSTOM_CODE:
+            label, offset = _read_string(view, offset)
+        else:
+            label = labels[code]
+        record = {codeField: label}
+        for field in fields:
+            record[field], offset = _read_string(view, offset)
+        # An unset id round-trips as None so the tree assigns a new one
+        record['id'] = record['id'] or None
+        records.append(record)
+    return records
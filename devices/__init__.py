@@ -26,49 +26,55 @@ Device Categories:
 - materialTestingDevices/: Testing equipment (viscometers, hardness testers)
 """
 
-from polariMaterialsScienceModule.devices.deviceCategory import DeviceCategory
-
-# 3D Printing Devices
-from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices import (
-    ThreeDimensionalPrintingDevice,
-    FDMPrinter,
-    SLAPrinter,
-    SLSPrinter
-)
-
-# CNC Mills
-from polariMaterialsScienceModule.devices.cncMills import (
-    CNCMill,
-    ThreeAxisMill,
-    FiveAxisMill
-)
-
-# CNC Lathes
-from polariMaterialsScienceModule.devices.cncLathes import (
-    CNCLathe
-)
-
-# Material Testing Devices
-from polariMaterialsScienceModule.devices.materialTestingDevices import (
-    MaterialTestingDevice,
-    Viscometer,
-    HardnessTester,
-    TensileTestingMachine,
-    ThermalAnalyzer
-)
+import importlib
+
+# Device classes are imported on first attribute access (PEP 562), so
+# using one device family does not load the others.
+_LAZY_MAP = {
+    'DeviceCategory': 'polariMaterialsScienceModule.devices.deviceCategory',
+    'DeviceCatalog': 'polariMaterialsScienceModule.devices.deviceCatalog',
+
+    # 3D Printing Devices
+    'ThreeDimensionalPrintingDevice': 'polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice',
+    'PrinterFeature': 'polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice',
+    'FDMPrinter': 'polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.fdmPrinter',
+    'SLAPrinter': 'polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.slaPrinter',
+    'SLSPrinter': 'polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.slsPrinter',
+
+    # CNC Mills
+    'CNCMill': 'polariMaterialsScienceModule.devices.cncMills.cncMill',
+    'MillFeature': 'polariMaterialsScienceModule.devices.cncMills.cncMill',
+    'ThreeAxisMill': 'polariMaterialsScienceModule.devices.cncMills.threeAxisMill',
+    'FiveAxisMill': 'polariMaterialsScienceModule.devices.cncMills.fiveAxisMill',
+
+    # CNC Lathes
+    'CNCLathe': 'polariMaterialsScienceModule.devices.cncLathes.cncLathe',
+
+    # Material Testing Devices
+    'MaterialTestingDevice': 'polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice',
+    'TestingFeature': 'polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice',
+    'Viscometer': 'polariMaterialsScienceModule.devices.materialTestingDevices.viscometer',
+    'HardnessTester': 'polariMaterialsScienceModule.devices.materialTestingDevices.hardnessTester',
+    'TensileTestingMachine': 'polariMaterialsScienceModule.devices.materialTestingDevices.tensileTestingMachine',
+    'TestingMode': 'polariMaterialsScienceModule.devices.materialTestingDevices.tensileTestingMachine',
+    'ThermalAnalyzer': 'polariMaterialsScienceModule.devices.materialTestingDevices.thermalAnalyzer',
+}
 
 __all__ = [
     # Base category
     'DeviceCategory',
+    'DeviceCatalog',
 
     # 3D Printing Devices
     'ThreeDimensionalPrintingDevice',
+    'PrinterFeature',
     'FDMPrinter',
     'SLAPrinter',
     'SLSPrinter',
 
     # CNC Mills
     'CNCMill',
+    'MillFeature',
     'ThreeAxisMill',
     'FiveAxisMill',
 
@@ -77,8 +83,25 @@ __all__ = [
 
     # Material Testing Devices
     'MaterialTestingDevice',
+    'TestingFeature',
     'Viscometer',
     'HardnessTester',
     'TensileTestingMachine',
+    'TestingMode',
     'ThermalAnalyzer'
 ]
+
+
+def __getattr__(name):
+    """Import and cache a public name on first access."""
+    try:
+        module = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,68 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Device Category Registry
+
+Assigns a small integer id to every DEVICE_CATEGORY string and maps each
+id to the device class that declares it. MaterialRelatedDevice registers
+its subclasses automatically, so category checks can compare
+DEVICE_CATEGORY_ID integers and category -> class lookups are a single
+dict access.
+
+Ids are assigned in class-definition order and are only meaningful
+within one process; persist the DEVICE_CATEGORY string, not the id.
+"""
+
+# Category name -> integer id. The empty (uncategorised) category is 0.
+CATEGORY_IDS = {'': 0}
+
+# Category id -> the device class that declares that category.
+CATEGORY_DISPATCH = {}
+
+
+def register(name):
+    """Return the integer id for a category name, assigning one if new."""
+    categoryId = CATEGORY_IDS.get(name)
+    if categoryId is None:
+        categoryId = CATEGORY_IDS[name] = len(CATEGORY_IDS)
+    return categoryId
+
+
+def register_class(cls):
+    """
+    Register a device class under its DEVICE_CATEGORY.
+
+    The first class to declare a category becomes its dispatch target;
+    subclasses that reuse an inherited category are not registered.
+
+    Returns:
+        int: The category id.
+    """
+    categoryId = register(cls.DEVICE_CATEGORY)
+    CATEGORY_DISPATCH.setdefault(categoryId, cls)
+    return categoryId
+
+
+def category_id(name):
+    """Return the id for a registered category name, or None."""
+    return CATEGORY_IDS.get(name)
+
+
+def class_for_category(category):
+    """Return the device class for a category name or id, or None."""
+    if isinstance(category, str):
+        category = CATEGORY_IDS.get(category)
+    return CATEGORY_DISPATCH.get(category)
@@ -19,8 +19,11 @@ CNCLathe Model
 CNC lathe/turning machine. For axially symmetric parts.
 """
 
+import math
+
 from objectTreeDecorators import treeObjectInit
 from polariMaterialsScienceModule.devices.deviceCategory import DeviceCategory
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class CNCLathe(DeviceCategory):
@@ -82,6 +85,40 @@ class CNCLathe(DeviceCategory):
 
     DEVICE_CATEGORY = 'cnc_lathe'
 
+    CATALOG_FIELDS = (
+        ('manufacturer', None),
+        ('model', None),
+        ('swingOverBed', 'f'),
+        ('swingOverCrossSlide', 'f'),
+        ('maxTurningDiameter', 'f'),
+        ('maxTurningLength', 'f'),
+        ('barCapacity', 'f'),
+        ('spindlePower', 'f'),
+        ('spindleSpeedMin', 'I'),
+        ('spindleSpeedMax', 'I'),
+        ('spindleBore', 'f'),
+        ('chuckSize', 'f'),
+        ('chuckType', None),
+        ('axisCount', 'B'),
+        ('xTravel', 'f'),
+        ('zTravel', 'f'),
+        ('cAxisAvailable', 'b'),
+        ('turretType', None),
+        ('turretStations', 'B'),
+        ('liveToolingAvailable', 'b'),
+        ('liveToolPower', 'f'),
+        ('liveToolSpeedMax', 'I'),
+        ('hasTailstock', 'b'),
+        ('tailstockTravel', 'f'),
+        ('rapidTraverseX', 'f'),
+        ('rapidTraverseZ', 'f'),
+        ('positioningAccuracy', 'f'),
+        ('repeatability', 'f'),
+        ('controllerBrand', None),
+        ('spindleSpeedRange', 'i'),
+        ('turningEnvelopeVolume', 'f'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -134,8 +171,8 @@ class CNCLathe(DeviceCategory):
         DeviceCategory.__init__(self, manager=manager, branch=branch, id=id,
                                 name=name, description=description,
                                 categoryDescription='CNC lathe/turning machine')
-        self.manufacturer = manufacturer
-        self.model = model
+        self.manufacturer = intern_value(manufacturer)
+        self.model = intern_value(model)
 
         # Capacity
         self.swingOverBed = swingOverBed
@@ -149,11 +186,11 @@ class CNCLathe(DeviceCategory):
         self.spindleSpeedMin = spindleSpeedMin
         self.spindleSpeedMax = spindleSpeedMax
         self.spindleBore = spindleBore
-        self.spindleNose = spindleNose
+        self.spindleNose = intern_value(spindleNose)
 
         # Chuck/Collet
         self.chuckSize = chuckSize
-        self.chuckType = chuckType
+        self.chuckType = intern_value(chuckType)
         self.colletType = colletType
 
         # Axes
@@ -163,7 +200,7 @@ class CNCLathe(DeviceCategory):
         self.cAxisAvailable = cAxisAvailable
 
         # Turret
-        self.turretType = turretType
+        self.turretType = intern_value(turretType)
         self.turretStations = turretStations
         self.liveToolingAvailable = liveToolingAvailable
         self.liveToolPower = liveToolPower
@@ -172,7 +209,7 @@ class CNCLathe(DeviceCategory):
         # Tailstock
         self.hasTailstock = hasTailstock
         self.tailstockTravel = tailstockTravel
-        self.tailstockTaper = tailstockTaper
+        self.tailstockTaper = intern_value(tailstockTaper)
 
         # Feed rates
         self.rapidTraverseX = rapidTraverseX
@@ -183,8 +220,19 @@ class CNCLathe(DeviceCategory):
         self.repeatability = repeatability
 
         # Control
-        self.controllerBrand = controllerBrand
+        self.controllerBrand = intern_value(controllerBrand)
         self.controllerModel = controllerModel
 
+    @property
+    def spindleSpeedRange(self):
+        """Usable spindle speed span (RPM)."""
+        return self.spindleSpeedMax - self.spindleSpeedMin
+
+    @property
+    def turningEnvelopeVolume(self):
+        """Cylindrical work envelope from max turning diameter and length (mm^3)."""
+        radius = self.maxTurningDiameter / 2.0
+        return math.pi * radius * radius * self.maxTurningLength
+
     def __repr__(self):
         return f"CNCLathe(id='{self.id}', name='{self.name}', swing={self.swingOverBed}mm)"
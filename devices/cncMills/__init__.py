@@ -19,12 +19,34 @@ CNC Mills Module
 Defines CNC milling machine devices and their capabilities.
 """
 
-from polariMaterialsScienceModule.devices.cncMills.cncMill import CNCMill
-from polariMaterialsScienceModule.devices.cncMills.threeAxisMill import ThreeAxisMill
-from polariMaterialsScienceModule.devices.cncMills.fiveAxisMill import FiveAxisMill
+import importlib
+
+# Device classes are imported on first attribute access (PEP 562).
+_LAZY_MAP = {
+    'CNCMill': 'polariMaterialsScienceModule.devices.cncMills.cncMill',
+    'MillFeature': 'polariMaterialsScienceModule.devices.cncMills.cncMill',
+    'ThreeAxisMill': 'polariMaterialsScienceModule.devices.cncMills.threeAxisMill',
+    'FiveAxisMill': 'polariMaterialsScienceModule.devices.cncMills.fiveAxisMill',
+}
 
 __all__ = [
     'CNCMill',
+    'MillFeature',
     'ThreeAxisMill',
     'FiveAxisMill'
 ]
+
+
+def __getattr__(name):
+    """Import and cache a public name on first access."""
+    try:
+        module = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
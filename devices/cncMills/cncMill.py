@@ -20,8 +20,19 @@ Base class for CNC milling machines. Defines common capabilities
 shared by all CNC mills.
 """
 
+from enum import IntFlag
+
 from objectTreeDecorators import treeObjectInit
 from polariMaterialsScienceModule.devices.deviceCategory import DeviceCategory
+from polariMaterialsScienceModule.fieldValues import intern_value, parse_dimensions
+
+
+class MillFeature(IntFlag):
+    """Bit flags for a mill's boolean capabilities (see CNCMill.featureFlags)."""
+    COOLANT_SYSTEM = 1
+    ROTARY_TABLE = 2
+    ENCLOSURE = 4
+    DUST_EXTRACTION = 8
 
 
 class CNCMill(DeviceCategory):
@@ -82,6 +93,44 @@ class CNCMill(DeviceCategory):
 
     DEVICE_CATEGORY = 'cnc_mill'
 
+    FEATURE_FIELDS = (
+        ('hasCoolantSystem', MillFeature.COOLANT_SYSTEM),
+        ('hasRotaryTable', MillFeature.ROTARY_TABLE),
+        ('hasEnclosure', MillFeature.ENCLOSURE),
+        ('hasDustExtraction', MillFeature.DUST_EXTRACTION),
+    )
+
+    CATALOG_FIELDS = (
+        ('manufacturer', None),
+        ('model', None),
+        ('axisCount', 'B'),
+        ('workEnvelopeX', 'f'),
+        ('workEnvelopeY', 'f'),
+        ('workEnvelopeZ', 'f'),
+        ('spindlePower', 'f'),
+        ('spindleSpeedMin', 'I'),
+        ('spindleSpeedMax', 'I'),
+        ('spindleTorqueMax', 'f'),
+        ('rapidTraverseX', 'f'),
+        ('rapidTraverseY', 'f'),
+        ('rapidTraverseZ', 'f'),
+        ('feedRateMax', 'f'),
+        ('positioningAccuracy', 'f'),
+        ('repeatability', 'f'),
+        ('toolChangerType', None),
+        ('toolCapacity', 'H'),
+        ('maxToolDiameter', 'f'),
+        ('maxToolLength', 'f'),
+        ('hasCoolantSystem', 'b'),
+        ('coolantType', None),
+        ('tableLoadCapacity', 'f'),
+        ('hasRotaryTable', 'b'),
+        ('controllerBrand', None),
+        ('hasEnclosure', 'b'),
+        ('hasDustExtraction', 'b'),
+        ('featureFlags', 'B'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -132,8 +181,8 @@ class CNCMill(DeviceCategory):
         DeviceCategory.__init__(self, manager=manager, branch=branch, id=id,
                                 name=name, description=description,
                                 categoryDescription='CNC milling machine')
-        self.manufacturer = manufacturer
-        self.model = model
+        self.manufacturer = intern_value(manufacturer)
+        self.model = intern_value(model)
 
         # Axes
         self.axisCount = axisCount
@@ -145,7 +194,7 @@ class CNCMill(DeviceCategory):
         self.spindlePower = spindlePower
         self.spindleSpeedMin = spindleSpeedMin
         self.spindleSpeedMax = spindleSpeedMax
-        self.spindleTaper = spindleTaper
+        self.spindleTaper = intern_value(spindleTaper)
         self.spindleTorqueMax = spindleTorqueMax
 
         # Feed rates
@@ -159,14 +208,14 @@ class CNCMill(DeviceCategory):
         self.repeatability = repeatability
 
         # Tool handling
-        self.toolChangerType = toolChangerType
+        self.toolChangerType = intern_value(toolChangerType)
         self.toolCapacity = toolCapacity
         self.maxToolDiameter = maxToolDiameter
         self.maxToolLength = maxToolLength
 
         # Coolant
         self.hasCoolantSystem = hasCoolantSystem
-        self.coolantType = coolantType
+        self.coolantType = intern_value(coolantType)
         self.coolantPressure = coolantPressure
 
         # Table
@@ -175,12 +224,17 @@ class CNCMill(DeviceCategory):
         self.hasRotaryTable = hasRotaryTable
 
         # Control
-        self.controllerBrand = controllerBrand
+        self.controllerBrand = intern_value(controllerBrand)
         self.controllerModel = controllerModel
 
         # Enclosure
         self.hasEnclosure = hasEnclosure
         self.hasDustExtraction = hasDustExtraction
 
+    @property
+    def tableDimensions(self):
+        """tableSize parsed into a tuple of floats, e.g. (600.0, 400.0) (mm)."""
+        return parse_dimensions(self.tableSize)
+
     def __repr__(self):
         return f"CNCMill(id='{self.id}', name='{self.name}', axes={self.axisCount})"
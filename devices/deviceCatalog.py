@@ -0,0 +1,91 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+DeviceCatalog
+
+Columnar mirror of a set of devices for bulk capability queries
+(e.g. "every lathe with swing >= 300mm and repeatability <= 0.005mm").
+The devices themselves remain the source of truth; the catalog copies
+the fields named by the device class's CATALOG_FIELDS.
+"""
+
+from polariMaterialsScienceModule.columnarTable import ColumnarTable
+
+
+class DeviceCatalog(ColumnarTable):
+    """
+    Columnar catalog of devices of a single class.
+
+    The catalog is synchronised explicitly: call add() when a device is
+    registered and update() after changing one of its catalog fields.
+
+    Attributes:
+        deviceClass: DeviceCategory subclass whose CATALOG_FIELDS define
+            the columns
+        devices: Devices in row order
+        rowIndex: Mapping of device ID -> row index
+    """
+
+    def __init__(self, deviceClass, devices=()):
+        if not deviceClass.CATALOG_FIELDS:
+            raise ValueError(f"{deviceClass.__name__} does not define CATALOG_FIELDS")
+        ColumnarTable.__init__(self, deviceClass.CATALOG_FIELDS)
+        self.deviceClass = deviceClass
+        self.devices = []
+        self.rowIndex = {}
+        for device in devices:
+            self.add(device)
+
+    def add(self, device):
+        """Add a device (or refresh it if already present). Returns its row index."""
+        if not isinstance(device, self.deviceClass):
+            raise TypeError(
+                f"DeviceCatalog for {self.deviceClass.__name__} cannot hold "
+                f"{type(device).__name__}"
+            )
+        row = self.rowIndex.get(device.id)
+        if row is not None:
+            self.update(device)
+            return row
+        row = self.append_object(device)
+        self.devices.append(device)
+        self.rowIndex[device.id] = row
+        return row
+
+    def update(self, device):
+        """Copy a device's current catalog field values into its row."""
+        self.set_row(self.rowIndex[device.id], {
+            name: getattr(device, name) for name, _ in self.fields
+        })
+
+    def query(self, **criteria):
+        """
+        Return the devices matching every criterion.
+
+        Criteria follow ColumnarTable.where(): a (low, high) tuple is an
+        inclusive range with optional bounds, anything else is an exact
+        match.
+        """
+        devices = self.devices
+        return [devices[row] for row in self.where(**criteria)]
+
+    def query_features(self, flags):
+        """Return the devices whose featureFlags include every bit in flags."""
+        devices = self.devices
+        return [devices[row] for row in self.where_flags('featureFlags', flags)]
+
+    def __repr__(self):
+        return f"DeviceCatalog(deviceClass={self.deviceClass.__name__}, devices={self.rowCount})"
@@ -20,11 +20,23 @@ Base class for device categories. Categories group related
 devices together (e.g., 3D printers, CNC machines, testing equipment).
 """
 
+import struct
+import weakref
+
 from objectTreeDecorators import treeObjectInit
+from polariMaterialsScienceModule.featureFlags import FeatureFlagsMixin
 from polariMaterialsScienceModule.materialRelatedDevice import MaterialRelatedDevice
 
+# Catalog typecode -> struct format and value coercion used by pack().
+# 'f' fields stay float32 to match the catalog columns; 'b' columns hold
+# flags and pack as bools.
+_PACK_FORMATS = dict(zip('bBhHiIlLqQfd', '?BhHiIlLqQfd'))
+_PACK_CONVERTERS = dict.fromkeys('BhHiIlLqQ', int)
+_PACK_CONVERTERS.update(dict.fromkeys('fd', float), b=bool)
+_STRING_LENGTH = struct.Struct('<H')
+
 
-class DeviceCategory(MaterialRelatedDevice):
+class DeviceCategory(FeatureFlagsMixin, MaterialRelatedDevice):
     """
     Base class for device categories.
 
@@ -39,6 +51,40 @@ class DeviceCategory(MaterialRelatedDevice):
 
     DEVICE_CATEGORY = 'category'
 
+    # (field, array typecode) pairs mirrored into a DeviceCatalog for bulk
+    # capability queries; typecode None keeps the column as a list.
+    CATALOG_FIELDS = ()
+
+    # Built from CATALOG_FIELDS by __init_subclass__: the fixed-width struct
+    # for the stored numeric fields, their names and coercions, and the
+    # string fields.
+    _PACK_STRUCT = struct.Struct('<')
+    _PACK_FIELDS = ()
+    _PACK_CONVERTERS = ()
+    _PACK_STRINGS = ()
+
+    # Named constructor kwargs for well-known models, used by from_preset().
+    PRESET_SPECS = {}
+
+    # Live shared spec records keyed by (class, manager, manufacturer, model),
+    # used by get_or_create(). Held weakly so unused specs can be freed.
+    _sharedSpecs = weakref.WeakValueDictionary()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Derived properties in the catalog (featureFlags, computed volumes)
+        # are not constructor fields, so they are left out of the packed form.
+        stored = [
+            (name, typecode) for name, typecode in cls.CATALOG_FIELDS
+            if not isinstance(getattr(cls, name, None), property)
+        ]
+        numeric = [(name, typecode) for name, typecode in stored if typecode]
+        cls._PACK_STRUCT = struct.Struct(
+            '<' + ''.join(_PACK_FORMATS[typecode] for _, typecode in numeric))
+        cls._PACK_FIELDS = tuple(name for name, _ in numeric)
+        cls._PACK_CONVERTERS = tuple(_PACK_CONVERTERS[typecode] for _, typecode in numeric)
+        cls._PACK_STRINGS = tuple(name for name, typecode in stored if not typecode)
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -51,5 +97,109 @@ class DeviceCategory(MaterialRelatedDevice):
                                        name=name, description=description)
         self.categoryDescription = categoryDescription
 
+    @classmethod
+    def get_or_create(cls, manufacturer, model, manager=None, **fields):
+        """
+        Return a shared device spec for a manufacturer/model, creating it if needed.
+
+        Intended for catalog entries describing a model's specification,
+        where many records name the same machine; individual physical units
+        (serial numbers, locations) should still be constructed directly.
+        Specs are shared only within one manager's tree, and a live instance
+        is reused only if it matches every given field.
+
+        Args:
+            manufacturer: Device manufacturer.
+            model: Model number/name.
+            manager: The object tree manager for a newly created device.
+            **fields: Other constructor fields.
+
+        Returns:
+            The existing or newly created device.
+        """
+        key = (cls, manager, manufacturer, model)
+        device = cls._sharedSpecs.get(key)
+        if device is not None and all(
+                getattr(device, name) == value for name, value in fields.items()):
+            return device
+        device = cls(manufacturer=manufacturer, model=model, manager=manager, **fields)
+        if key not in cls._sharedSpecs:
+            cls._sharedSpecs[key] = device
+        return device
+
+    def pack(self):
+        """
+        Encode this device's catalog fields as compact bytes.
+
+        Numeric fields are written with the fixed struct layout derived
+        from CATALOG_FIELDS (unset values as 0, each coerced to its field's
+        type, so a whole float in an integer field packs), followed by each
+        string field as a uint16 byte length and UTF-8 bytes. 'f' fields
+        are float32, so they unpack rounded to single precision. Only
+        catalog fields are included; use unpack() on the same class to
+        decode.
+        """
+        parts = [self._PACK_STRUCT.pack(*(
+            convert(getattr(self, name) or 0)
+            for name, convert in zip(self._PACK_FIELDS, self._PACK_CONVERTERS)))]
+        for name in self._PACK_STRINGS:
+            data = (getattr(self, name) or '').encode('utf-8')
+            parts.append(_STRING_LENGTH.pack(len(data)))
+            parts.append(data)
+        return b''.join(parts)
+
+    @classmethod
+    def unpack(cls, data):
+        """
+        Decode bytes from pack() into a dict of catalog field values.
+
+        The keys match the __init__ kwargs, so the result can be passed
+        to the constructor or to from_records().
+        """
+        view = memoryview(data)
+        record = dict(zip(cls._PACK_FIELDS, cls._PACK_STRUCT.unpack_from(view, 0)))
+        offset = cls._PACK_STRUCT.size
+        for name in cls._PACK_STRINGS:
+            (length,) = _STRING_LENGTH.unpack_from(view, offset)
+            offset += _STRING_LENGTH.size
+            record[name] = str(view[offset:offset + length], 'utf-8')
+            offset += length
+        return record
+
+    @classmethod
+    def from_preset(cls, preset, manager=None):
+        """
+        Return the shared device spec for a named entry in PRESET_SPECS.
+
+        Presets go through get_or_create(), so every caller asking for the
+        same preset gets the same instance while it is alive.
+
+        Raises:
+            ValueError: If the preset is not defined for this class.
+        """
+        spec = cls.PRESET_SPECS.get(preset)
+        if spec is None:
+            raise ValueError(f"Unknown {cls.__name__} preset '{preset}'")
+        return cls.get_or_create(manager=manager, **spec)
+
+    @classmethod
+    def from_records(cls, records, manager=None):
+        """
+        Construct devices of this class from a sequence of field dicts.
+
+        Each device goes through its normal constructor, so tree
+        registration still happens. A 'manager' key carried by a record is
+        dropped in favour of manager, so records exported alongside their
+        manager load without a duplicate-keyword TypeError.
+
+        Args:
+            records: Iterable of dicts whose keys match the __init__ kwargs.
+            manager: The object tree manager to register the devices with.
+
+        Returns:
+            list: The constructed devices, in record order.
+        """
+        return [cls(**{**record, 'manager': manager}) for record in records]
+
     def __repr__(self):
         return f"DeviceCategory(id='{self.id}', name='{self.name}')"
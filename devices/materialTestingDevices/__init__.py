@@ -20,16 +20,18 @@ Defines material testing equipment and their capabilities.
 These devices measure material properties.
 """
 
-from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice
+from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice, TestingFeature
 from polariMaterialsScienceModule.devices.materialTestingDevices.viscometer import Viscometer
 from polariMaterialsScienceModule.devices.materialTestingDevices.hardnessTester import HardnessTester
-from polariMaterialsScienceModule.devices.materialTestingDevices.tensileTestingMachine import TensileTestingMachine
+from polariMaterialsScienceModule.devices.materialTestingDevices.tensileTestingMachine import TensileTestingMachine, TestingMode
 from polariMaterialsScienceModule.devices.materialTestingDevices.thermalAnalyzer import ThermalAnalyzer
 
 __all__ = [
     'MaterialTestingDevice',
+    'TestingFeature',
     'Viscometer',
     'HardnessTester',
     'TensileTestingMachine',
+    'TestingMode',
     'ThermalAnalyzer'
 ]
@@ -20,7 +20,8 @@ Hardness measurement device. Various scales for different materials.
 """
 
 from objectTreeDecorators import treeObjectInit
-from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice
+from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice, TestingFeature
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class HardnessTester(MaterialTestingDevice):
@@ -40,6 +41,22 @@ class HardnessTester(MaterialTestingDevice):
         sampleThicknessMin: Minimum sample thickness (mm)
     """
 
+    FEATURE_FIELDS = MaterialTestingDevice.FEATURE_FIELDS + (
+        ('digitalReadout', TestingFeature.DIGITAL_READOUT),
+        ('automaticLoadApplication', TestingFeature.AUTOMATIC_LOAD_APPLICATION),
+    )
+
+    CATALOG_FIELDS = MaterialTestingDevice.CATALOG_FIELDS + (
+        ('hardnessScale', None),
+        ('indenterType', None),
+        ('loadMin', 'f'),
+        ('loadMax', 'f'),
+        ('dwellTime', 'f'),
+        ('digitalReadout', 'b'),
+        ('automaticLoadApplication', 'b'),
+        ('sampleThicknessMin', 'f'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -65,8 +82,8 @@ class HardnessTester(MaterialTestingDevice):
             testingType='mechanical',
             standardsCompliance=standardsCompliance)
 
-        self.hardnessScale = hardnessScale
-        self.indenterType = indenterType
+        self.hardnessScale = intern_value(hardnessScale)
+        self.indenterType = intern_value(indenterType)
         self.loadMin = loadMin
         self.loadMax = loadMax
         self.dwellTime = dwellTime
@@ -20,8 +20,20 @@ Base class for material testing equipment. These devices are used
 to measure material properties and generate property measurements.
 """
 
+from enum import IntFlag
+
 from objectTreeDecorators import treeObjectInit
 from polariMaterialsScienceModule.devices.deviceCategory import DeviceCategory
+from polariMaterialsScienceModule.fieldValues import intern_value, split_csv_set
+
+
+class TestingFeature(IntFlag):
+    """Bit flags for testing-device boolean capabilities (see featureFlags)."""
+    CALIBRATION_REQUIRED = 1
+    DIGITAL_READOUT = 2
+    AUTOMATIC_LOAD_APPLICATION = 4
+    EXTENSOMETER = 8
+    ENVIRONMENTAL_CHAMBER = 16
 
 
 class MaterialTestingDevice(DeviceCategory):
@@ -45,6 +57,19 @@ class MaterialTestingDevice(DeviceCategory):
 
     DEVICE_CATEGORY = 'material_testing'
 
+    FEATURE_FIELDS = (
+        ('calibrationRequired', TestingFeature.CALIBRATION_REQUIRED),
+    )
+
+    CATALOG_FIELDS = (
+        ('manufacturer', None),
+        ('model', None),
+        ('testingType', None),
+        ('calibrationRequired', 'b'),
+        ('calibrationInterval', 'H'),
+        ('featureFlags', 'B'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -66,10 +91,10 @@ class MaterialTestingDevice(DeviceCategory):
         DeviceCategory.__init__(self, manager=manager, branch=branch, id=id,
                                 name=name, description=description,
                                 categoryDescription='Material testing equipment')
-        self.manufacturer = manufacturer
-        self.model = model
-        self.testingType = testingType
-        self.standardsCompliance = standardsCompliance
+        self.manufacturer = intern_value(manufacturer)
+        self.model = intern_value(model)
+        self.testingType = intern_value(testingType)
+        self.standardsCompliance = intern_value(standardsCompliance)
         self.measurementRange = measurementRange
         self.accuracy = accuracy
         self.resolution = resolution
@@ -78,5 +103,14 @@ class MaterialTestingDevice(DeviceCategory):
         self.samplePreparation = samplePreparation
         self.testDuration = testDuration
 
+    @property
+    def standardsSet(self):
+        """Frozenset of the standards listed in standardsCompliance."""
+        return split_csv_set(self.standardsCompliance)
+
+    def complies_with(self, standard):
+        """Check whether standardsCompliance lists the given standard (e.g. 'ASTM D638')."""
+        return standard in split_csv_set(self.standardsCompliance)
+
     def __repr__(self):
         return f"MaterialTestingDevice(id='{self.id}', name='{self.name}', type='{self.testingType}')"
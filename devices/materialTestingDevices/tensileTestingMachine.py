@@ -19,8 +19,32 @@ TensileTestingMachine Model
 Universal testing machine for tensile, compression, and flexural testing.
 """
 
+from enum import IntFlag
+from functools import lru_cache
+
 from objectTreeDecorators import treeObjectInit
-from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice
+from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice, TestingFeature
+from polariMaterialsScienceModule.fieldValues import split_csv, parse_range
+
+
+class TestingMode(IntFlag):
+    """Bit flags for the testing modes a machine supports."""
+    TENSILE = 1
+    COMPRESSION = 2
+    FLEXURE = 4
+    SHEAR = 8
+    PEEL = 16
+    CYCLIC = 32
+
+
+@lru_cache(maxsize=256)
+def _testing_mode_flags(testingModes):
+    flags = TestingMode(0)
+    for mode in split_csv(testingModes):
+        flag = TestingMode.__members__.get(mode.upper())
+        if flag is not None:
+            flags |= flag
+    return flags
 
 
 class TensileTestingMachine(MaterialTestingDevice):
@@ -44,6 +68,22 @@ class TensileTestingMachine(MaterialTestingDevice):
         temperatureRange: Temperature range if chamber available (C)
     """
 
+    FEATURE_FIELDS = MaterialTestingDevice.FEATURE_FIELDS + (
+        ('extensometerAvailable', TestingFeature.EXTENSOMETER),
+        ('environmentalChamber', TestingFeature.ENVIRONMENTAL_CHAMBER),
+    )
+
+    CATALOG_FIELDS = MaterialTestingDevice.CATALOG_FIELDS + (
+        ('loadCapacity', 'f'),
+        ('crossheadSpeedMin', 'f'),
+        ('crossheadSpeedMax', 'f'),
+        ('crossheadTravel', 'f'),
+        ('frameStiffness', 'f'),
+        ('extensometerAvailable', 'b'),
+        ('extensometerGaugeLength', 'f'),
+        ('environmentalChamber', 'b'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -86,5 +126,39 @@ class TensileTestingMachine(MaterialTestingDevice):
         self.environmentalChamber = environmentalChamber
         self.temperatureRange = temperatureRange
 
+    @property
+    def testingModeFlags(self):
+        """testingModes parsed into TestingMode flags (unknown modes are ignored)."""
+        return _testing_mode_flags(self.testingModes)
+
+    @property
+    def loadCellList(self):
+        """Tuple of the entries in loadCellsAvailable."""
+        return split_csv(self.loadCellsAvailable)
+
+    @property
+    def gripList(self):
+        """Tuple of the entries in gripsAvailable."""
+        return split_csv(self.gripsAvailable)
+
+    @property
+    def temperatureRangeBounds(self):
+        """temperatureRange parsed into (low, high) in C, or None if unset."""
+        return parse_range(self.temperatureRange)
+
+    def supports_mode(self, mode):
+        """
+        Check whether the machine supports a testing mode.
+
+        Args:
+            mode: A TestingMode flag (or combination), or a mode name
+                such as 'flexure'.
+        """
+        if isinstance(mode, str):
+            mode = TestingMode.__members__.get(mode.strip().upper())
+            if mode is None:
+                return False
+        return self.testingModeFlags & mode == mode
+
     def __repr__(self):
         return f"TensileTestingMachine(id='{self.id}', name='{self.name}', capacity={self.loadCapacity}kN)"
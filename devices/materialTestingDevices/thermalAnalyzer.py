@@ -21,6 +21,7 @@ Thermal analysis equipment: DSC, TGA, DMA, TMA, etc.
 
 from objectTreeDecorators import treeObjectInit
 from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice
+from polariMaterialsScienceModule.fieldValues import intern_value, split_csv_set
 
 
 class ThermalAnalyzer(MaterialTestingDevice):
@@ -52,6 +53,23 @@ class ThermalAnalyzer(MaterialTestingDevice):
         deformationModes: Available deformation modes
     """
 
+    CATALOG_FIELDS = MaterialTestingDevice.CATALOG_FIELDS + (
+        ('analyzerType', None),
+        ('temperatureRangeMin', 'f'),
+        ('temperatureRangeMax', 'f'),
+        ('heatingRateMin', 'f'),
+        ('heatingRateMax', 'f'),
+        ('coolingRateMin', 'f'),
+        ('coolingRateMax', 'f'),
+        ('atmosphereControl', None),
+        ('sampleMassMax', 'f'),
+        ('heatFlowResolution', 'f'),
+        ('enthalpyAccuracy', 'f'),
+        ('frequencyRangeMin', 'f'),
+        ('frequencyRangeMax', 'f'),
+        ('forceRangeMax', 'f'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -87,15 +105,15 @@ class ThermalAnalyzer(MaterialTestingDevice):
             testingType='thermal',
             standardsCompliance=standardsCompliance)
 
-        self.analyzerType = analyzerType
+        self.analyzerType = intern_value(analyzerType)
         self.temperatureRangeMin = temperatureRangeMin
         self.temperatureRangeMax = temperatureRangeMax
         self.heatingRateMin = heatingRateMin
         self.heatingRateMax = heatingRateMax
         self.coolingRateMin = coolingRateMin
         self.coolingRateMax = coolingRateMax
-        self.atmosphereControl = atmosphereControl
-        self.samplePanType = samplePanType
+        self.atmosphereControl = intern_value(atmosphereControl)
+        self.samplePanType = intern_value(samplePanType)
         self.sampleMassMax = sampleMassMax
 
         # DSC specific
@@ -108,5 +126,10 @@ class ThermalAnalyzer(MaterialTestingDevice):
         self.forceRangeMax = forceRangeMax
         self.deformationModes = deformationModes
 
+    @property
+    def deformationModeSet(self):
+        """Frozenset of the entries in deformationModes."""
+        return split_csv_set(self.deformationModes)
+
     def __repr__(self):
         return f"ThermalAnalyzer(id='{self.id}', name='{self.name}', type='{self.analyzerType}')"
@@ -21,6 +21,7 @@ Viscosity measurement device. Various types for different applications.
 
 from objectTreeDecorators import treeObjectInit
 from polariMaterialsScienceModule.devices.materialTestingDevices.materialTestingDevice import MaterialTestingDevice
+from polariMaterialsScienceModule.fieldValues import intern_value, split_csv
 
 
 class Viscometer(MaterialTestingDevice):
@@ -42,6 +43,18 @@ class Viscometer(MaterialTestingDevice):
         sampleVolumeRequired: Sample volume required (ml)
     """
 
+    CATALOG_FIELDS = MaterialTestingDevice.CATALOG_FIELDS + (
+        ('viscometerType', None),
+        ('viscosityRangeMin', 'f'),
+        ('viscosityRangeMax', 'f'),
+        ('shearRateRangeMin', 'f'),
+        ('shearRateRangeMax', 'f'),
+        ('temperatureRangeMin', 'f'),
+        ('temperatureRangeMax', 'f'),
+        ('temperatureControl', None),
+        ('sampleVolumeRequired', 'f'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -69,16 +82,21 @@ class Viscometer(MaterialTestingDevice):
             testingType='rheological',
             standardsCompliance=standardsCompliance)
 
-        self.viscometerType = viscometerType
+        self.viscometerType = intern_value(viscometerType)
         self.viscosityRangeMin = viscosityRangeMin
         self.viscosityRangeMax = viscosityRangeMax
         self.shearRateRangeMin = shearRateRangeMin
         self.shearRateRangeMax = shearRateRangeMax
         self.temperatureRangeMin = temperatureRangeMin
         self.temperatureRangeMax = temperatureRangeMax
-        self.temperatureControl = temperatureControl
+        self.temperatureControl = intern_value(temperatureControl)
         self.spindleSet = spindleSet
         self.sampleVolumeRequired = sampleVolumeRequired
 
+    @property
+    def spindles(self):
+        """Tuple of the entries in spindleSet."""
+        return split_csv(self.spindleSet)
+
     def __repr__(self):
         return f"Viscometer(id='{self.id}', name='{self.name}', type='{self.viscometerType}')"
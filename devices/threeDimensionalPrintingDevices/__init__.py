@@ -19,13 +19,14 @@
 Defines 3D printer devices and their capabilities.
 """
 
-from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice
+from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice, PrinterFeature
 from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.fdmPrinter import FDMPrinter
 from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.slaPrinter import SLAPrinter
 from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.slsPrinter import SLSPrinter
 
 __all__ = [
     'ThreeDimensionalPrintingDevice',
+    'PrinterFeature',
     'FDMPrinter',
     'SLAPrinter',
     'SLSPrinter'
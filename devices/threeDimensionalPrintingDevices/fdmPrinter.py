@@ -21,7 +21,8 @@ Defines capabilities specific to filament-based 3D printing.
 """
 
 from objectTreeDecorators import treeObjectInit
-from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice
+from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice, PrinterFeature
+from polariMaterialsScienceModule.fieldValues import intern_value, split_float_csv
 
 
 class FDMPrinter(ThreeDimensionalPrintingDevice):
@@ -66,6 +67,53 @@ class FDMPrinter(ThreeDimensionalPrintingDevice):
         hasFilamentDryer: Whether integrated dryer exists
     """
 
+    FEATURE_FIELDS = ThreeDimensionalPrintingDevice.FEATURE_FIELDS + (
+        ('hasHardenedNozzle', PrinterFeature.HARDENED_NOZZLE),
+        ('hasHeatedBed', PrinterFeature.HEATED_BED),
+        ('retractionCapable', PrinterFeature.RETRACTION),
+        ('multiMaterialCapable', PrinterFeature.MULTI_MATERIAL),
+        ('hasFilamentRunoutSensor', PrinterFeature.FILAMENT_RUNOUT_SENSOR),
+        ('hasFilamentDryer', PrinterFeature.FILAMENT_DRYER),
+    )
+
+    CATALOG_FIELDS = ThreeDimensionalPrintingDevice.CATALOG_FIELDS + (
+        ('nozzleDiameter', 'f'),
+        ('hotendTempMax', 'f'),
+        ('hotendType', None),
+        ('hasHardenedNozzle', 'b'),
+        ('nozzleMaterial', None),
+        ('bedTempMax', 'f'),
+        ('bedSurface', None),
+        ('hasHeatedBed', 'b'),
+        ('extruderType', None),
+        ('filamentDiameter', 'f'),
+        ('maxExtrusionSpeed', 'f'),
+        ('retractionCapable', 'b'),
+        ('multiMaterialCapable', 'b'),
+        ('extruderCount', 'B'),
+        ('maxPrintSpeed', 'f'),
+        ('maxTravelSpeed', 'f'),
+        ('accelerationMax', 'f'),
+        ('enclosureTempMax', 'f'),
+        ('hasFilamentRunoutSensor', 'b'),
+        ('hasFilamentDryer', 'b'),
+    )
+
+    PRESET_SPECS = {
+        'ender3': dict(
+            name='Ender 3', manufacturer='Creality', model='Ender-3',
+            buildVolumeX=220.0, buildVolumeY=220.0, buildVolumeZ=250.0,
+            hotendTempMax=240.0, hotendType='ptfe-lined',
+            bedTempMax=100.0, bedSurface='magnetic', bedLevelingType='manual',
+            extruderType='bowden', maxPrintSpeed=180.0),
+        'prusa_mk4': dict(
+            name='Prusa MK4', manufacturer='Prusa Research', model='MK4',
+            buildVolumeX=250.0, buildVolumeY=210.0, buildVolumeZ=220.0,
+            hotendTempMax=290.0, hotendType='all-metal',
+            bedTempMax=120.0, bedSurface='pei', bedLevelingType='mesh',
+            extruderType='direct', hasFilamentRunoutSensor=True),
+    }
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -126,18 +174,18 @@ class FDMPrinter(ThreeDimensionalPrintingDevice):
         self.nozzleDiameter = nozzleDiameter
         self.nozzleDiametersAvailable = nozzleDiametersAvailable
         self.hotendTempMax = hotendTempMax
-        self.hotendType = hotendType
+        self.hotendType = intern_value(hotendType)
         self.hasHardenedNozzle = hasHardenedNozzle
-        self.nozzleMaterial = nozzleMaterial
+        self.nozzleMaterial = intern_value(nozzleMaterial)
 
         # Bed
         self.bedTempMax = bedTempMax
-        self.bedSurface = bedSurface
+        self.bedSurface = intern_value(bedSurface)
         self.hasHeatedBed = hasHeatedBed
-        self.bedLevelingType = bedLevelingType
+        self.bedLevelingType = intern_value(bedLevelingType)
 
         # Extruder
-        self.extruderType = extruderType
+        self.extruderType = intern_value(extruderType)
         self.filamentDiameter = filamentDiameter
         self.maxExtrusionSpeed = maxExtrusionSpeed
         self.retractionCapable = retractionCapable
@@ -154,5 +202,14 @@ class FDMPrinter(ThreeDimensionalPrintingDevice):
         self.hasFilamentRunoutSensor = hasFilamentRunoutSensor
         self.hasFilamentDryer = hasFilamentDryer
 
+    @property
+    def nozzleDiameters(self):
+        """nozzleDiametersAvailable parsed into a tuple of floats (mm)."""
+        return split_float_csv(self.nozzleDiametersAvailable)
+
+    def supports_nozzle_diameter(self, diameter):
+        """Check whether a nozzle diameter (mm) is listed as available."""
+        return float(diameter) in split_float_csv(self.nozzleDiametersAvailable)
+
     def __repr__(self):
         return f"FDMPrinter(id='{self.id}', name='{self.name}', hotendMax={self.hotendTempMax}C)"
@@ -21,7 +21,8 @@ Defines capabilities specific to resin-based 3D printing.
 """
 
 from objectTreeDecorators import treeObjectInit
-from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice
+from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice, PrinterFeature
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class SLAPrinter(ThreeDimensionalPrintingDevice):
@@ -64,6 +65,50 @@ class SLAPrinter(ThreeDimensionalPrintingDevice):
         greyLevelCount: Number of grey levels for AA
     """
 
+    FEATURE_FIELDS = ThreeDimensionalPrintingDevice.FEATURE_FIELDS + (
+        ('hasHeatedVat', PrinterFeature.HEATED_VAT),
+        ('hasFlexibleBuildPlate', PrinterFeature.FLEXIBLE_BUILD_PLATE),
+        ('hasResinLevelSensor', PrinterFeature.RESIN_LEVEL_SENSOR),
+        ('hasAirFiltration', PrinterFeature.AIR_FILTRATION),
+        ('hasResinHeating', PrinterFeature.RESIN_HEATING),
+        ('antiAliasingSupport', PrinterFeature.ANTI_ALIASING),
+    )
+
+    CATALOG_FIELDS = ThreeDimensionalPrintingDevice.CATALOG_FIELDS + (
+        ('lightSourceType', None),
+        ('wavelength', 'H'),
+        ('lightPower', 'f'),
+        ('xyResolution', 'f'),
+        ('vatMaterial', None),
+        ('vatCapacity', 'f'),
+        ('hasHeatedVat', 'b'),
+        ('vatTempMax', 'f'),
+        ('hasFlexibleBuildPlate', 'b'),
+        ('zAxisResolution', 'f'),
+        ('liftSpeed', 'f'),
+        ('retractSpeed', 'f'),
+        ('hasResinLevelSensor', 'b'),
+        ('hasAirFiltration', 'b'),
+        ('hasResinHeating', 'b'),
+        ('antiAliasingSupport', 'b'),
+        ('greyLevelCount', 'H'),
+    )
+
+    PRESET_SPECS = {
+        'form3': dict(
+            name='Form 3', manufacturer='Formlabs', model='Form 3',
+            buildVolumeX=145.0, buildVolumeY=145.0, buildVolumeZ=185.0,
+            minLayerHeight=0.025, maxLayerHeight=0.3,
+            lightSourceType='laser', wavelength=405, lightPower=250.0,
+            xyResolution=25.0, hasHeatedVat=True, vatTempMax=35.0,
+            hasResinLevelSensor=True),
+        'mars3': dict(
+            name='Mars 3', manufacturer='Elegoo', model='Mars 3',
+            buildVolumeX=143.0, buildVolumeY=89.0, buildVolumeZ=175.0,
+            minLayerHeight=0.01, maxLayerHeight=0.2,
+            lightSourceType='lcd', wavelength=405, xyResolution=35.0),
+    }
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -114,19 +159,19 @@ class SLAPrinter(ThreeDimensionalPrintingDevice):
             maxLayerHeight=maxLayerHeight)
 
         # Light source
-        self.lightSourceType = lightSourceType
+        self.lightSourceType = intern_value(lightSourceType)
         self.wavelength = wavelength
         self.lightPower = lightPower
         self.xyResolution = xyResolution
 
         # Vat/Tank
-        self.vatMaterial = vatMaterial
+        self.vatMaterial = intern_value(vatMaterial)
         self.vatCapacity = vatCapacity
         self.hasHeatedVat = hasHeatedVat
         self.vatTempMax = vatTempMax
 
         # Build plate
-        self.buildPlateMaterial = buildPlateMaterial
+        self.buildPlateMaterial = intern_value(buildPlateMaterial)
         self.hasFlexibleBuildPlate = hasFlexibleBuildPlate
 
         # Motion
@@ -21,7 +21,8 @@ Defines capabilities specific to powder-based 3D printing.
 """
 
 from objectTreeDecorators import treeObjectInit
-from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice
+from polariMaterialsScienceModule.devices.threeDimensionalPrintingDevices.threeDimensionalPrintingDevice import ThreeDimensionalPrintingDevice, PrinterFeature
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class SLSPrinter(ThreeDimensionalPrintingDevice):
@@ -61,6 +62,44 @@ class SLSPrinter(ThreeDimensionalPrintingDevice):
         hasPowderContainment: Whether powder containment system exists
     """
 
+    FEATURE_FIELDS = ThreeDimensionalPrintingDevice.FEATURE_FIELDS + (
+        ('hasPowderRecycling', PrinterFeature.POWDER_RECYCLING),
+        ('hasInertAtmosphere', PrinterFeature.INERT_ATMOSPHERE),
+        ('hasChamberHeating', PrinterFeature.CHAMBER_HEATING),
+        ('hasFireSuppression', PrinterFeature.FIRE_SUPPRESSION),
+        ('hasPowderContainment', PrinterFeature.POWDER_CONTAINMENT),
+    )
+
+    CATALOG_FIELDS = ThreeDimensionalPrintingDevice.CATALOG_FIELDS + (
+        ('laserType', None),
+        ('laserPower', 'f'),
+        ('laserSpotSize', 'f'),
+        ('scanSpeed', 'f'),
+        ('bedTempMax', 'f'),
+        ('bedHeatingZones', 'B'),
+        ('powderLayerThicknessMin', 'f'),
+        ('powderLayerThicknessMax', 'f'),
+        ('powderCapacity', 'f'),
+        ('hasPowderRecycling', 'b'),
+        ('hasInertAtmosphere', 'b'),
+        ('atmosphereType', None),
+        ('hasChamberHeating', 'b'),
+        ('chamberTempMax', 'f'),
+        ('cooldownTimeTypical', 'f'),
+        ('hasFireSuppression', 'b'),
+        ('hasPowderContainment', 'b'),
+    )
+
+    PRESET_SPECS = {
+        'fuse1': dict(
+            name='Fuse 1', manufacturer='Formlabs', model='Fuse 1',
+            buildVolumeX=165.0, buildVolumeY=165.0, buildVolumeZ=300.0,
+            minLayerHeight=0.11, maxLayerHeight=0.11,
+            laserType='fiber', laserPower=10.0,
+            powderLayerThicknessMin=0.11, powderLayerThicknessMax=0.11,
+            hasPowderRecycling=True),
+    }
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -110,7 +149,7 @@ class SLSPrinter(ThreeDimensionalPrintingDevice):
             hasEnclosure=True)
 
         # Laser
-        self.laserType = laserType
+        self.laserType = intern_value(laserType)
         self.laserPower = laserPower
         self.laserSpotSize = laserSpotSize
         self.scanSpeed = scanSpeed
@@ -125,7 +164,7 @@ class SLSPrinter(ThreeDimensionalPrintingDevice):
         self.powderCapacity = powderCapacity
         self.hasPowderRecycling = hasPowderRecycling
         self.hasInertAtmosphere = hasInertAtmosphere
-        self.atmosphereType = atmosphereType
+        self.atmosphereType = intern_value(atmosphereType)
 
         # Thermal management
         self.hasChamberHeating = hasChamberHeating
@@ -20,8 +20,34 @@ Base class for 3D printing devices. Defines common capabilities
 that all 3D printers share.
 """
 
+from enum import IntFlag
+
 from objectTreeDecorators import treeObjectInit
 from polariMaterialsScienceModule.devices.deviceCategory import DeviceCategory
+from polariMaterialsScienceModule.fieldValues import intern_value, split_csv, split_csv_set
+
+
+class PrinterFeature(IntFlag):
+    """Bit flags for 3D printer boolean capabilities (see featureFlags)."""
+    ENCLOSURE = 1
+    HEATED_ENCLOSURE = 2
+    HARDENED_NOZZLE = 4
+    HEATED_BED = 8
+    RETRACTION = 16
+    MULTI_MATERIAL = 32
+    FILAMENT_RUNOUT_SENSOR = 64
+    FILAMENT_DRYER = 128
+    HEATED_VAT = 256
+    FLEXIBLE_BUILD_PLATE = 512
+    RESIN_LEVEL_SENSOR = 1024
+    AIR_FILTRATION = 2048
+    RESIN_HEATING = 4096
+    ANTI_ALIASING = 8192
+    POWDER_RECYCLING = 16384
+    INERT_ATMOSPHERE = 32768
+    CHAMBER_HEATING = 65536
+    FIRE_SUPPRESSION = 131072
+    POWDER_CONTAINMENT = 262144
 
 
 class ThreeDimensionalPrintingDevice(DeviceCategory):
@@ -49,6 +75,27 @@ class ThreeDimensionalPrintingDevice(DeviceCategory):
 
     DEVICE_CATEGORY = '3d_printing'
 
+    FEATURE_FIELDS = (
+        ('hasEnclosure', PrinterFeature.ENCLOSURE),
+        ('hasHeatedEnclosure', PrinterFeature.HEATED_ENCLOSURE),
+    )
+
+    CATALOG_FIELDS = (
+        ('manufacturer', None),
+        ('model', None),
+        ('printingTechnology', None),
+        ('buildVolumeX', 'f'),
+        ('buildVolumeY', 'f'),
+        ('buildVolumeZ', 'f'),
+        ('minLayerHeight', 'f'),
+        ('maxLayerHeight', 'f'),
+        ('positioningAccuracyXY', 'f'),
+        ('positioningAccuracyZ', 'f'),
+        ('hasEnclosure', 'b'),
+        ('hasHeatedEnclosure', 'b'),
+        ('featureFlags', 'I'),
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -74,9 +121,9 @@ class ThreeDimensionalPrintingDevice(DeviceCategory):
         DeviceCategory.__init__(self, manager=manager, branch=branch, id=id,
                                 name=name, description=description,
                                 categoryDescription='3D printing device')
-        self.manufacturer = manufacturer
-        self.model = model
-        self.printingTechnology = printingTechnology
+        self.manufacturer = intern_value(manufacturer)
+        self.model = intern_value(model)
+        self.printingTechnology = intern_value(printingTechnology)
         self.buildVolumeX = buildVolumeX
         self.buildVolumeY = buildVolumeY
         self.buildVolumeZ = buildVolumeZ
@@ -90,5 +137,24 @@ class ThreeDimensionalPrintingDevice(DeviceCategory):
         self.slicerSoftware = slicerSoftware
         self.fileFormats = fileFormats
 
+    @property
+    def connectivityOptions(self):
+        """Frozenset of the entries in connectivity."""
+        return split_csv_set(self.connectivity)
+
+    @property
+    def slicerSoftwareList(self):
+        """Tuple of the entries in slicerSoftware."""
+        return split_csv(self.slicerSoftware)
+
+    @property
+    def fileFormatSet(self):
+        """Frozenset of the entries in fileFormats."""
+        return split_csv_set(self.fileFormats)
+
+    def supports_file_format(self, fileFormat):
+        """Check whether fileFormats lists the given format (e.g. 'stl')."""
+        return fileFormat in split_csv_set(self.fileFormats)
+
     def __repr__(self):
         return f"ThreeDimensionalPrintingDevice(id='{self.id}', name='{self.name}', tech='{self.printingTechnology}')"
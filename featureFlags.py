@@ -0,0 +1,61 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Feature Flags
+
+Packs a model's boolean fields into a single IntFlag value, so columnar
+mirrors can store and filter them as one integer column. Models keep
+storing the individual booleans; the packed value is derived on read.
+"""
+
+
+def pack_feature_flags(featureFields, getValue):
+    """
+    Fold boolean fields into one flag value.
+
+    Args:
+        featureFields: (field name, flag) pairs, as in FEATURE_FIELDS.
+        getValue: Callable returning a field's value by name, e.g. a
+            record's dict.get or an object's __getattribute__.
+
+    Returns:
+        int: The OR of the flags whose field is truthy.
+    """
+    flags = 0
+    for field, flag in featureFields:
+        if getValue(field):
+            flags |= flag
+    return flags
+
+
+class FeatureFlagsMixin:
+    """
+    Adds featureFlags and has_features() to a model.
+
+    Attributes:
+        FEATURE_FIELDS: (boolean field, flag) pairs folded into featureFlags
+    """
+
+    FEATURE_FIELDS = ()
+
+    @property
+    def featureFlags(self):
+        """The boolean fields named in FEATURE_FIELDS, packed into one flag value."""
+        return pack_feature_flags(self.FEATURE_FIELDS, self.__getattribute__)
+
+    def has_features(self, flags):
+        """Check whether every boolean field in flags is set."""
+        return self.featureFlags & flags == flags
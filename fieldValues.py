@@ -0,0 +1,139 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Field Value Helpers
+
+Shared parsing helpers for the flat string fields used across the module
+(comma-separated ID lists, option lists, etc.). Models keep storing the
+plain strings; these helpers provide the parsed views.
+"""
+
+import re
+import sys
+from functools import lru_cache
+
+_NUMBER = r'[-+]?\d+(?:\.\d*)?|[-+]?\.\d+'
+_NUMBERS = re.compile(_NUMBER)
+_RANGE = re.compile(
+    r'^\s*(' + _NUMBER + r')\s*(?:to|\.\.|,|-|\u2013)\s*(' + _NUMBER + r')'
+)
+
+
+@lru_cache(maxsize=4096)
+def split_csv(value):
+    """
+    Split a comma-separated field into a tuple of stripped tokens.
+
+    Empty tokens are dropped. Results are cached by input string, so
+    repeated parses of the same field value are a dictionary lookup.
+
+    Args:
+        value: Comma-separated string (None and '' give an empty tuple).
+
+    Returns:
+        tuple: Interned, stripped, non-empty tokens in original order.
+    """
+    if not value:
+        return ()
+    return tuple(sys.intern(token) for token in map(str.strip, value.split(',')) if token)
+
+
+@lru_cache(maxsize=1024)
+def split_csv_set(value):
+    """
+    Split a comma-separated field into a frozenset of stripped tokens.
+
+    Like split_csv(), results are cached by input string, so every field
+    holding the same value shares one frozenset.
+    """
+    return frozenset(split_csv(value))
+
+
+@lru_cache(maxsize=1024)
+def split_float_csv(value):
+    """
+    Split a comma-separated list of numbers into a tuple of floats.
+
+    Tokens that are not numbers are skipped. Cached by input string.
+    """
+    numbers = []
+    for token in split_csv(value):
+        try:
+            numbers.append(float(token))
+        except ValueError:
+            pass
+    return tuple(numbers)
+
+
+def intern_value(value):
+    """
+    Intern a categorical string field value.
+
+    Vocabulary-style fields (types, levels, brands) repeat the same few
+    labels across many instances; interning makes every instance share
+    one string object. Non-string values are returned unchanged.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _parse_dimensions(value):
+    return tuple(float(number) for number in _NUMBERS.findall(value))
+
+
+def parse_dimensions(value):
+    """
+    Parse a dimension string such as '600 x 400' or '600x400 mm'.
+
+    Args:
+        value: Dimension string, or an already-parsed sequence of numbers.
+
+    Returns:
+        tuple: The dimensions as floats, in order (empty if none found).
+    """
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return _parse_dimensions(value)
+    return tuple(float(number) for number in value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_range(value):
+    match = _RANGE.match(value)
+    if match is None:
+        return None
+    return float(match.group(1)), float(match.group(2))
+
+
+def parse_range(value):
+    """
+    Parse a range string such as '-70 to 250', '-70..250' or '20-250'.
+
+    Args:
+        value: Range string, or an already-parsed (low, high) pair.
+
+    Returns:
+        tuple: (low, high) as floats, or None if the value is not a range.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return _parse_range(value)
+    low, high = value
+    return float(low), float(high)
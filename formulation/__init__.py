@@ -23,9 +23,14 @@ declares its role (base, additive, compatibilizer) and expected effects.
 from polariMaterialsScienceModule.formulation.formulation import Formulation
 from polariMaterialsScienceModule.formulation.formulationComponent import FormulationComponent
 from polariMaterialsScienceModule.formulation.formulationIntent import FormulationIntent
+from polariMaterialsScienceModule.formulation.formulationComponentTable import FormulationComponentTable, ComponentRole
+from polariMaterialsScienceModule.formulation.formulationIndex import FormulationIndex
 
 __all__ = [
     'Formulation',
     'FormulationComponent',
-    'FormulationIntent'
+    'FormulationIntent',
+    'FormulationComponentTable',
+    'ComponentRole',
+    'FormulationIndex'
 ]
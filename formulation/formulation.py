@@ -20,6 +20,7 @@ A composite material recipe combining multiple materials.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class Formulation(treeObject):
@@ -49,10 +50,10 @@ class Formulation(treeObject):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
         self.name = name
         self.description = description
-        self.targetProfileId = targetProfileId
-        self.baseMaterialId = baseMaterialId
+        self.targetProfileId = intern_value(targetProfileId)
+        self.baseMaterialId = intern_value(baseMaterialId)
         self.totalAdditiveLoadPercent = totalAdditiveLoadPercent
-        self.provenanceId = provenanceId
+        self.provenanceId = intern_value(provenanceId)
 
     def __repr__(self):
         return f"Formulation(id='{self.id}', name='{self.name}')"
@@ -20,6 +20,7 @@ A single component in a formulation recipe with explicit role reporting.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value, split_csv_set
 
 
 class FormulationComponent(treeObject):
@@ -51,14 +52,52 @@ class FormulationComponent(treeObject):
                  mixingInstructions='',
                  expectedPropertyEffects=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.formulationId = formulationId
-        self.materialId = materialId
-        self.role = role
+        self.formulationId = intern_value(formulationId)
+        self.materialId = intern_value(materialId)
+        self.role = intern_value(role)
         self.roleJustification = roleJustification
         self.weightPercent = weightPercent
         self.orderOfAddition = orderOfAddition
         self.mixingInstructions = mixingInstructions
         self.expectedPropertyEffects = expectedPropertyEffects
 
+    @property
+    def expectedPropertyEffectSet(self):
+        """Frozenset of the property names listed in expectedPropertyEffects."""
+        return split_csv_set(self.expectedPropertyEffects)
+
+    def targets_property(self, propertyName):
+        """Check whether expectedPropertyEffects lists the given property."""
+        return propertyName in split_csv_set(self.expectedPropertyEffects)
+
+    @classmethod
+    def resolve_materials(cls, components, materials):
+        """
+        Resolve the material referenced by each of many components.
+
+        Builds a single id -> material index and answers every lookup
+        from it, so a working set of a few materials shared by many
+        components is resolved with one dict probe per component.
+
+        Args:
+            components: Iterable of FormulationComponent instances.
+            materials: Mapping of material ID -> material, or an iterable
+                of material instances (RawMaterial, Material, ...).
+
+        Returns:
+            dict: Component ID -> material, for components whose
+                materialId has a match.
+        """
+        if hasattr(materials, 'get'):
+            by_id = materials
+        else:
+            by_id = {material.id: material for material in materials}
+        resolved = {}
+        for component in components:
+            material = by_id.get(component.materialId)
+            if material is not None:
+                resolved[component.id] = material
+        return resolved
+
     def __repr__(self):
         return f"FormulationComponent(id='{self.id}', material='{self.materialId}', role='{self.role}', weight={self.weightPercent}%)"
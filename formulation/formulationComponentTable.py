@@ -0,0 +1,324 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+FormulationComponentTable
+
+Columnar view of formulation components for bulk formulation math:
+weight totals, role filtering, addition-order sorting and blended
+property estimates run over packed columns instead of component objects.
+Like DeviceCatalog, the table is a mirror; the FormulationComponent
+objects remain the source of truth.
+"""
+
+import json
+from enum import IntEnum
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from polariMaterialsScienceModule.columnarTable import ColumnarTable
+from polariMaterialsScienceModule.formulation.formulationComponent import FormulationComponent
+
+
+class ComponentRole(IntEnum):
+    """Integer codes for FormulationComponent.role in the role column."""
+    # Unset or unrecognised roles; 0 so rows missing a role land here.
+    OTHER = 0
+    BASE = 1
+    ADDITIVE = 2
+    COMPATIBILIZER = 3
+
+
+_ROLE_CODES = {
+    'base': ComponentRole.BASE,
+    'additive': ComponentRole.ADDITIVE,
+    'compatibilizer': ComponentRole.COMPATIBILIZER,
+}
+
+
+def role_code(role):
+    """Return the ComponentRole code for a role string (OTHER if unrecognised)."""
+    return _ROLE_CODES.get(role, ComponentRole.OTHER)
+
+
+class FormulationComponentTable(ColumnarTable):
+    """
+    Columnar table of formulation components.
+
+    Attributes:
+        components: FormulationComponent objects in row order (None for
+            rows appended from plain records until component() is called)
+        records: The source record dict of each row appended from a plain
+            record, kept until component() builds its object (None otherwise)
+        rowIndex: Mapping of component ID -> row index
+        formulationRows: Mapping of formulationId -> row indices, so the
+            components of one formulation are a flat list of rows
+    """
+
+    FIELDS = (
+        ('id', None),
+        ('formulationId', None),
+        ('materialId', None),
+        ('role', 'B'),
+        ('weightPercent', 'd'),
+        ('orderOfAddition', 'i'),
+    )
+
+    def __init__(self, components=()):
+        ColumnarTable.__init__(self, self.FIELDS)
+        self.components = []
+        self.records = []
+        self.rowIndex = {}
+        self.formulationRows = {}
+        for component in components:
+            self.add(component)
+
+    @classmethod
+    def from_objects(cls, components):
+        """Build a table from FormulationComponent objects."""
+        return cls(components)
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a table from plain record dicts without constructing components.
+
+        Keys match the FormulationComponent __init__ kwargs. Only the
+        table's columns are used for queries, but each record is kept whole
+        so component() can build an exact object from it.
+        """
+        table = cls()
+        table.extend(records)
+        return table
+
+    @classmethod
+    def from_json(cls, filepath):
+        """Build a table from a JSON array of component records."""
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        return cls.from_records(orjson.loads(data) if orjson is not None else json.loads(data))
+
+    @classmethod
+    def from_jsonl(cls, filepath):
+        """Build a table from a JSON Lines file, one component record per line."""
+        loads = orjson.loads if orjson is not None else json.loads
+        table = cls()
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    table.append(loads(line))
+        return table
+
+    def add(self, component):
+        """Add a component (or refresh it if already present). Returns its row index."""
+        row = self.rowIndex.get(component.id)
+        if row is not None:
+            self.update(component)
+            self.components[row] = component
+            self.records[row] = None
+            return row
+        record = self._record(component)
+        row = ColumnarTable.append(self, record)
+        self.components.append(component)
+        self.records.append(None)
+        if component.id is not None:
+            self.rowIndex[component.id] = row
+        self.formulationRows.setdefault(record['formulationId'], []).append(row)
+        return row
+
+    def update(self, component):
+        """Copy a component's current field values into its row."""
+        row = self.rowIndex[component.id]
+        previous = self.columns['formulationId'][row]
+        # Write the row first: set_row() is all-or-nothing, so the index
+        # only moves once the new values are stored.
+        self.set_row(row, self._record(component))
+        if previous != component.formulationId:
+            self.formulationRows[previous].remove(row)
+            self.formulationRows.setdefault(component.formulationId, []).append(row)
+
+    def component(self, index, manager=None):
+        """
+        Return the FormulationComponent for a row, constructing it on first use.
+
+        Rows appended from plain records have no object until requested.
+        The object is built from the row's original record, not the packed
+        columns, so fields without a column (roleJustification,
+        mixingInstructions, ...) come back as loaded. The constructed
+        component (registered with manager) is kept for later calls and
+        replaces the stored record.
+        """
+        component = self.components[index]
+        if component is None:
+            # Null fields in the source record are left to the constructor
+            # defaults.
+            record = {name: value for name, value in self.records[index].items() if value is not None}
+            role = record.get('role')
+            if role is not None and not isinstance(role, str):
+                record['role'] = self.role_name(role)
+            component = self.components[index] = FormulationComponent(manager=manager, **record)
+            self.records[index] = None
+        return component
+
+    def to_objects(self, manager=None):
+        """Return a FormulationComponent for every row (see component())."""
+        return [self.component(index, manager) for index in range(self.rowCount)]
+
+    def append(self, record):
+        """
+        Append a plain record dict with no backing component object.
+
+        A string 'role' is encoded to its ComponentRole code. A record whose
+        id is already in the table refreshes that row, as add() does, and
+        replaces any component object built for it. Returns the row index.
+        """
+        source = record
+        role = record.get('role')
+        if isinstance(role, str):
+            record = dict(record, role=role_code(role))
+        row = self.rowIndex.get(record.get('id'))
+        if row is not None:
+            previous = self.columns['formulationId'][row]
+            self.set_row(row, {name: record.get(name) for name, _ in self.fields})
+            if previous != record.get('formulationId'):
+                self.formulationRows[previous].remove(row)
+                self.formulationRows.setdefault(record.get('formulationId'), []).append(row)
+            self.components[row] = None
+            self.records[row] = source
+            return row
+        row = ColumnarTable.append(self, record)
+        self.components.append(None)
+        self.records.append(source)
+        if record.get('id') is not None:
+            self.rowIndex[record['id']] = row
+        self.formulationRows.setdefault(record.get('formulationId'), []).append(row)
+        return row
+
+    def rows_for_formulation(self, formulationId):
+        """Return the row indices of a formulation's components (in row order)."""
+        return sorted(self.formulationRows.get(formulationId, ()))
+
+    def formulation_totals(self):
+        """Return a mapping of formulationId -> summed weightPercent, in one pass."""
+        weights = self.columns['weightPercent']
+        return {
+            formulationId: float(sum(weights[i] for i in rows))
+            for formulationId, rows in self.formulationRows.items()
+        }
+
+    @staticmethod
+    def role_name(code):
+        """Return the role string for a ComponentRole code ('' for OTHER)."""
+        return '' if code == ComponentRole.OTHER else ComponentRole(code).name.lower()
+
+    def total_weight_percent(self, rows=None):
+        """Sum weightPercent over all rows, or over the given row indices."""
+        weights = self.column('weightPercent')
+        if rows is not None:
+            return float(sum(weights[i] for i in rows))
+        if numpy is not None:
+            return float(weights.sum())
+        return float(sum(weights))
+
+    def rows_with_role(self, role):
+        """Return the row indices whose role matches a role string or ComponentRole."""
+        code = role_code(role) if isinstance(role, str) else int(role)
+        if numpy is not None:
+            return numpy.flatnonzero(self.column('role') == code).tolist()
+        # The role column is one byte per row, so bytes.find() scans it in C.
+        data = self.columns['role'].tobytes()
+        target = bytes((code,))
+        rows = []
+        row = data.find(target)
+        while row != -1:
+            rows.append(row)
+            row = data.find(target, row + 1)
+        return rows
+
+    def count_role(self, role):
+        """Return the number of rows with a role (e.g. to check for exactly one base)."""
+        code = role_code(role) if isinstance(role, str) else int(role)
+        if numpy is not None:
+            return int(numpy.count_nonzero(self.column('role') == code))
+        return self.columns['role'].tobytes().count(bytes((code,)))
+
+    def rows_in_addition_order(self, rows=None):
+        """Return row indices sorted by orderOfAddition (stable for ties)."""
+        order = self.column('orderOfAddition')
+        if numpy is not None:
+            if rows is None:
+                return numpy.argsort(order, kind='stable').tolist()
+            rows = numpy.asarray(rows, dtype=numpy.intp)
+            return rows[numpy.argsort(order[rows], kind='stable')].tolist()
+        if rows is None:
+            rows = range(self.rowCount)
+        return sorted(rows, key=order.__getitem__)
+
+    def components_in_addition_order(self, formulationId, manager=None):
+        """Return a formulation's components sorted by orderOfAddition (see component())."""
+        return [
+            self.component(row, manager)
+            for row in self.rows_in_addition_order(self.rows_for_formulation(formulationId))
+        ]
+
+    def blend_property(self, effectPerWeightPercent, rows=None):
+        """
+        Estimate a blended property change as sum(weightPercent * effect).
+
+        Args:
+            effectPerWeightPercent: Mapping of materialId -> effect per
+                weight percent (e.g. from PropertyEffect records).
+                Materials without an entry contribute nothing.
+            rows: Optional row indices to restrict the blend to.
+
+        Returns:
+            float: The summed effect.
+        """
+        materialIds = self.columns['materialId']
+        if rows is None and numpy is not None:
+            effects = numpy.fromiter(
+                (effectPerWeightPercent.get(materialId, 0.0) for materialId in materialIds),
+                dtype='d', count=self.rowCount,
+            )
+            return float(numpy.dot(self.column('weightPercent'), effects))
+        if rows is None:
+            rows = range(self.rowCount)
+        weights = self.columns['weightPercent']
+        return float(sum(
+            weights[i] * effectPerWeightPercent.get(materialIds[i], 0.0)
+            for i in rows
+        ))
+
+    @staticmethod
+    def _record(component):
+        return {
+            'id': component.id,
+            'formulationId': component.formulationId,
+            'materialId': component.materialId,
+            'role': role_code(component.role),
+            'weightPercent': component.weightPercent,
+            'orderOfAddition': component.orderOfAddition,
+        }
+
+    def __repr__(self):
+        return f"FormulationComponentTable(components={self.rowCount})"
@@ -0,0 +1,84 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+FormulationIndex
+
+Child index from a formulation ID to its FormulationComponent and
+FormulationIntent objects, so "all components of formulation F" costs
+O(children) rather than a scan of every component. Children are held
+through weak references, so the index never keeps a deleted object alive.
+"""
+
+import weakref
+
+
+class FormulationIndex:
+    """
+    Weak child index for formulations.
+
+    Synchronised explicitly, like DeviceCatalog and
+    AdditiveCompatibilityIndex: call add_component()/add_intent() for each
+    child created or loaded, and again after changing its formulationId.
+
+    Attributes:
+        components: Mapping of formulationId -> WeakSet of FormulationComponent
+        intents: Mapping of formulationId -> WeakSet of FormulationIntent
+    """
+
+    def __init__(self, components=(), intents=()):
+        self.components = {}
+        self.intents = {}
+        # Object -> the formulationId it is currently filed under, so a
+        # re-added child with a new formulationId moves rather than duplicates.
+        self._filedUnder = weakref.WeakKeyDictionary()
+        for component in components:
+            self.add_component(component)
+        for intent in intents:
+            self.add_intent(intent)
+
+    def add_component(self, component):
+        """File a FormulationComponent under its formulationId."""
+        self._file(self.components, component)
+
+    def add_intent(self, intent):
+        """File a FormulationIntent under its formulationId."""
+        self._file(self.intents, intent)
+
+    def _file(self, groups, child):
+        previous = self._filedUnder.get(child)
+        if previous is not None and previous[1] != child.formulationId:
+            previous[0].get(previous[1], weakref.WeakSet()).discard(child)
+        groups.setdefault(child.formulationId, weakref.WeakSet()).add(child)
+        self._filedUnder[child] = (groups, child.formulationId)
+
+    def remove(self, child):
+        """Remove a component or intent from the index (no-op if not indexed)."""
+        previous = self._filedUnder.pop(child, None)
+        if previous is not None:
+            previous[0].get(previous[1], weakref.WeakSet()).discard(child)
+
+    def components_of(self, formulationId):
+        """Return the live components of a formulation, sorted by orderOfAddition."""
+        return sorted(self.components.get(formulationId, ()),
+                      key=lambda component: component.orderOfAddition)
+
+    def intents_of(self, formulationId):
+        """Return the live intents of a formulation."""
+        return list(self.intents.get(formulationId, ()))
+
+    def __repr__(self):
+        return (f"FormulationIndex(formulations={len(self.components)}, "
+                f"withIntents={len(self.intents)})")
@@ -20,6 +20,7 @@ Desired property direction for a formulation.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class FormulationIntent(treeObject):
@@ -43,10 +44,10 @@ class FormulationIntent(treeObject):
                  direction='',
                  priority=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.formulationId = formulationId
+        self.formulationId = intern_value(formulationId)
         self.propertyName = propertyName
-        self.direction = direction
-        self.priority = priority
+        self.direction = intern_value(direction)
+        self.priority = intern_value(priority)
 
     def __repr__(self):
         return f"FormulationIntent(id='{self.id}', property='{self.propertyName}', direction='{self.direction}')"
@@ -37,6 +37,7 @@ Example:
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class Material(treeObject):
@@ -72,7 +73,7 @@ class Material(treeObject):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
         self.name = name
         self.description = description
-        self.category = category
+        self.category = intern_value(category)
         self.manufacturer = manufacturer
         self.tradeName = tradeName
         self.cas = cas
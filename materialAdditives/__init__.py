@@ -23,12 +23,16 @@ and compatibilizer materials.
 
 from polariMaterialsScienceModule.materialAdditives.materialAdditive import MaterialAdditive
 from polariMaterialsScienceModule.materialAdditives.propertyEffect import PropertyEffect
+from polariMaterialsScienceModule.materialAdditives.propertyEffectTable import PropertyEffectTable
 from polariMaterialsScienceModule.materialAdditives.additiveCompatibility import AdditiveCompatibility
+from polariMaterialsScienceModule.materialAdditives.additiveCompatibilityIndex import AdditiveCompatibilityIndex
 from polariMaterialsScienceModule.materialAdditives.compatibilizer import Compatibilizer
 
 __all__ = [
     'MaterialAdditive',
     'PropertyEffect',
+    'PropertyEffectTable',
     'AdditiveCompatibility',
+    'AdditiveCompatibilityIndex',
     'Compatibilizer'
 ]
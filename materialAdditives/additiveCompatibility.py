@@ -20,6 +20,7 @@ Compatibility record between an additive and a base material.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class AdditiveCompatibility(treeObject):
@@ -51,14 +52,14 @@ class AdditiveCompatibility(treeObject):
                  notes='',
                  provenanceId=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.additiveId = additiveId
-        self.baseMaterialId = baseMaterialId
+        self.additiveId = intern_value(additiveId)
+        self.baseMaterialId = intern_value(baseMaterialId)
         self.compatible = compatible
         self.requiresCompatibilizer = requiresCompatibilizer
-        self.compatibilizerId = compatibilizerId
+        self.compatibilizerId = intern_value(compatibilizerId)
         self.maxLoadingWithBase = maxLoadingWithBase
         self.notes = notes
-        self.provenanceId = provenanceId
+        self.provenanceId = intern_value(provenanceId)
 
     def __repr__(self):
         return f"AdditiveCompatibility(id='{self.id}', additive='{self.additiveId}', base='{self.baseMaterialId}', compatible={self.compatible})"
@@ -0,0 +1,84 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+AdditiveCompatibilityIndex
+
+Hash index over AdditiveCompatibility records keyed by
+(additiveId, baseMaterialId), so "is additive A compatible with base B?"
+is a single dict lookup instead of a scan over every record.
+"""
+
+
+class AdditiveCompatibilityIndex:
+    """
+    Lookup index of AdditiveCompatibility records.
+
+    The index is synchronised explicitly, like DeviceCatalog: call add()
+    when a record is created or loaded, and remove() before deleting it
+    or changing its additiveId/baseMaterialId.
+
+    Attributes:
+        records: Mapping of (additiveId, baseMaterialId) -> AdditiveCompatibility
+        basesByAdditive: Mapping of additiveId -> {baseMaterialId: AdditiveCompatibility}
+    """
+
+    def __init__(self, records=()):
+        self.records = {}
+        self.basesByAdditive = {}
+        for record in records:
+            self.add(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return key in self.records
+
+    def add(self, record):
+        """Index a record, replacing any existing record for the same pair."""
+        self.records[(record.additiveId, record.baseMaterialId)] = record
+        self.basesByAdditive.setdefault(record.additiveId, {})[record.baseMaterialId] = record
+
+    def remove(self, record):
+        """Remove a record from the index (no-op if it is not indexed)."""
+        key = (record.additiveId, record.baseMaterialId)
+        if self.records.get(key) is not record:
+            return
+        del self.records[key]
+        bases = self.basesByAdditive[record.additiveId]
+        del bases[record.baseMaterialId]
+        if not bases:
+            del self.basesByAdditive[record.additiveId]
+
+    def lookup(self, additiveId, baseMaterialId):
+        """Return the record for an additive/base pair, or None."""
+        return self.records.get((additiveId, baseMaterialId))
+
+    def is_compatible(self, additiveId, baseMaterialId):
+        """Check whether a pair has a record marked compatible (False if unrecorded)."""
+        record = self.records.get((additiveId, baseMaterialId))
+        return record is not None and bool(record.compatible)
+
+    def compatible_bases(self, additiveId):
+        """Return the base material IDs recorded as compatible with an additive."""
+        return [
+            baseMaterialId
+            for baseMaterialId, record in self.basesByAdditive.get(additiveId, {}).items()
+            if record.compatible
+        ]
+
+    def __repr__(self):
+        return f"AdditiveCompatibilityIndex(records={len(self.records)})"
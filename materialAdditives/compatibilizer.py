@@ -22,6 +22,7 @@ dispersants, and surfactants.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value, split_csv_set
 
 
 class Compatibilizer(treeObject):
@@ -51,13 +52,31 @@ class Compatibilizer(treeObject):
                  compatibleAdditiveTypes='',
                  provenanceId=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.rawMaterialId = rawMaterialId
+        self.rawMaterialId = intern_value(rawMaterialId)
         self.name = name
-        self.compatibilizationType = compatibilizationType
+        self.compatibilizationType = intern_value(compatibilizationType)
         self.effectiveness = effectiveness
         self.compatibleBaseTypes = compatibleBaseTypes
         self.compatibleAdditiveTypes = compatibleAdditiveTypes
-        self.provenanceId = provenanceId
+        self.provenanceId = intern_value(provenanceId)
+
+    @property
+    def compatibleBaseTypeSet(self):
+        """Frozenset of the base material types listed in compatibleBaseTypes."""
+        return split_csv_set(self.compatibleBaseTypes)
+
+    @property
+    def compatibleAdditiveTypeSet(self):
+        """Frozenset of the additive types listed in compatibleAdditiveTypes."""
+        return split_csv_set(self.compatibleAdditiveTypes)
+
+    def supports_base(self, baseType):
+        """Check whether compatibleBaseTypes lists the given base material type."""
+        return baseType in split_csv_set(self.compatibleBaseTypes)
+
+    def supports_additive(self, additiveType):
+        """Check whether compatibleAdditiveTypes lists the given additive type."""
+        return additiveType in split_csv_set(self.compatibleAdditiveTypes)
 
     def __repr__(self):
         return f"Compatibilizer(id='{self.id}', name='{self.name}', type='{self.compatibilizationType}')"
@@ -20,6 +20,7 @@ A material used as an additive to modify properties of a base material.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class MaterialAdditive(treeObject):
@@ -49,13 +50,13 @@ class MaterialAdditive(treeObject):
                  compatibilizerRequired=False,
                  provenanceId=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.rawMaterialId = rawMaterialId
+        self.rawMaterialId = intern_value(rawMaterialId)
         self.name = name
         self.description = description
-        self.additiveForm = additiveForm
+        self.additiveForm = intern_value(additiveForm)
         self.maxLoadingPercent = maxLoadingPercent
         self.compatibilizerRequired = compatibilizerRequired
-        self.provenanceId = provenanceId
+        self.provenanceId = intern_value(provenanceId)
 
     def __repr__(self):
         return f"MaterialAdditive(id='{self.id}', name='{self.name}', form='{self.additiveForm}')"
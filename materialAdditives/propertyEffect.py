@@ -20,6 +20,7 @@ How an additive affects a specific material property.
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class PropertyEffect(treeObject):
@@ -51,14 +52,14 @@ class PropertyEffect(treeObject):
                  testConditions='',
                  provenanceId=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.additiveId = additiveId
+        self.additiveId = intern_value(additiveId)
         self.propertyName = propertyName
-        self.intent = intent
+        self.intent = intern_value(intent)
         self.normalizedEffectStrength = normalizedEffectStrength
         self.effectPerWeightPercent = effectPerWeightPercent
         self.effectUnit = effectUnit
         self.testConditions = testConditions
-        self.provenanceId = provenanceId
+        self.provenanceId = intern_value(provenanceId)
 
     def __repr__(self):
         return f"PropertyEffect(id='{self.id}', additive='{self.additiveId}', property='{self.propertyName}', intent='{self.intent}')"
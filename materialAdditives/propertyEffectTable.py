@@ -0,0 +1,129 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+PropertyEffectTable
+
+Columnar view of PropertyEffect records for blended property estimates.
+Effects are indexed by (additiveId, propertyName) and by propertyName, so
+the effects relevant to one property are gathered as row indices and
+combined with additive weights in a single dot product.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from polariMaterialsScienceModule.columnarTable import ColumnarTable
+
+
+class PropertyEffectTable(ColumnarTable):
+    """
+    Columnar table of property effects.
+
+    Synchronised explicitly like DeviceCatalog: call add() for new or
+    loaded effects and again after editing one.
+
+    Attributes:
+        effects: PropertyEffect objects in row order
+        rowIndex: Mapping of (additiveId, propertyName) -> row index
+        propertyRows: Mapping of propertyName -> row indices
+    """
+
+    FIELDS = (
+        ('id', None),
+        ('additiveId', None),
+        ('propertyName', None),
+        ('intent', None),
+        ('normalizedEffectStrength', 'd'),
+        ('effectPerWeightPercent', 'd'),
+    )
+
+    def __init__(self, effects=()):
+        ColumnarTable.__init__(self, self.FIELDS)
+        self.effects = []
+        self.rowIndex = {}
+        self.propertyRows = {}
+        for effect in effects:
+            self.add(effect)
+
+    def add(self, effect):
+        """
+        Add an effect, or refresh the row already held for its
+        (additiveId, propertyName) pair. Returns its row index.
+        """
+        key = (effect.additiveId, effect.propertyName)
+        record = {name: getattr(effect, name) for name, _ in self.fields}
+        row = self.rowIndex.get(key)
+        if row is not None:
+            self.set_row(row, record)
+            self.effects[row] = effect
+            return row
+        row = self.append(record)
+        self.effects.append(effect)
+        self.rowIndex[key] = row
+        self.propertyRows.setdefault(effect.propertyName, []).append(row)
+        return row
+
+    def lookup(self, additiveId, propertyName):
+        """Return the PropertyEffect for an additive/property pair, or None."""
+        row = self.rowIndex.get((additiveId, propertyName))
+        return None if row is None else self.effects[row]
+
+    def effects_for(self, propertyName):
+        """
+        Return a mapping of additiveId -> effectPerWeightPercent for one property.
+
+        The result can be passed to FormulationComponentTable.blend_property().
+        """
+        additiveIds = self.columns['additiveId']
+        values = self.columns['effectPerWeightPercent']
+        return {
+            additiveIds[row]: values[row]
+            for row in self.propertyRows.get(propertyName, ())
+        }
+
+    def blend(self, propertyName, weights):
+        """
+        Estimate a blended change in one property.
+
+        Args:
+            propertyName: The property to blend (e.g. 'Hardness').
+            weights: Mapping of additiveId -> weight percent in the blend.
+
+        Returns:
+            float: sum(weightPercent * effectPerWeightPercent) over the
+                additives with a recorded effect on the property. Values are
+                used as stored; intent is not applied as a sign.
+        """
+        rowIndex = self.rowIndex
+        rows = []
+        rowWeights = []
+        for additiveId, weight in weights.items():
+            row = rowIndex.get((additiveId, propertyName))
+            if row is not None:
+                rows.append(row)
+                rowWeights.append(weight)
+        if not rows:
+            return 0.0
+        if numpy is not None:
+            effects = self.column('effectPerWeightPercent')[rows]
+            return float(numpy.dot(effects, numpy.asarray(rowWeights, dtype='d')))
+        values = self.columns['effectPerWeightPercent']
+        return float(sum(values[row] * weight for row, weight in zip(rows, rowWeights)))
+
+    def __repr__(self):
+        return f"PropertyEffectTable(effects={self.rowCount})"
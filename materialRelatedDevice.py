@@ -30,6 +30,8 @@ Relationship:
 """
 
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.devices import categoryRegistry
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class MaterialRelatedDevice(treeObject):
@@ -54,6 +56,14 @@ class MaterialRelatedDevice(treeObject):
     """
 
     DEVICE_CATEGORY = ''
+    DEVICE_CATEGORY_ID = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Classes declaring their own category get a registry id; others
+        # inherit their parent's DEVICE_CATEGORY_ID.
+        if 'DEVICE_CATEGORY' in cls.__dict__:
+            cls.DEVICE_CATEGORY_ID = categoryRegistry.register_class(cls)
 
     @treeObjectInit
     def __init__(self,
@@ -75,11 +85,11 @@ class MaterialRelatedDevice(treeObject):
         self.name = name
         self.description = description
         self.deviceCategory = deviceCategory or self.DEVICE_CATEGORY
-        self.manufacturer = manufacturer
-        self.model = model
+        self.manufacturer = intern_value(manufacturer)
+        self.model = intern_value(model)
         self.serialNumber = serialNumber
         self.location = location
-        self.status = status
+        self.status = intern_value(status)
         self.acquisitionDate = acquisitionDate
         self.lastCalibrationDate = lastCalibrationDate
         self.notes = notes
@@ -63,6 +63,32 @@ class MaterialResolution(treeObject):
     RESOLUTION_LEVEL = None  # Override in subclasses
     RESOLUTION_CATEGORY = ''  # Override in subclasses
 
+    # Category name for each resolution level, indexed by level.
+    RESOLUTION_CATEGORIES = ('experimental', 'continuum', 'mesoscale', 'atomistic', 'quantum')
+
+    # RESOLUTION_LEVEL -> class, filled in by __init_subclass__.
+    _resolutionClasses = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Validated once per class; instances copy the constants unchecked.
+        if 'RESOLUTION_LEVEL' in cls.__dict__ and cls.RESOLUTION_LEVEL is not None:
+            categories = MaterialResolution.RESOLUTION_CATEGORIES
+            if not (0 <= cls.RESOLUTION_LEVEL < len(categories)
+                    and categories[cls.RESOLUTION_LEVEL] == cls.RESOLUTION_CATEGORY):
+                raise ValueError(
+                    f"{cls.__name__} has RESOLUTION_LEVEL {cls.RESOLUTION_LEVEL} with "
+                    f"RESOLUTION_CATEGORY '{cls.RESOLUTION_CATEGORY}'")
+            MaterialResolution._resolutionClasses[cls.RESOLUTION_LEVEL] = cls
+
+    @staticmethod
+    def resolution_class(resolutionLevel):
+        """Return the MaterialResolution subclass registered for a resolution level."""
+        cls = MaterialResolution._resolutionClasses.get(resolutionLevel)
+        if cls is None:
+            raise ValueError(f"Unknown resolution level {resolutionLevel}")
+        return cls
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
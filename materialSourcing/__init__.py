@@ -21,6 +21,7 @@ Defines sourcing options for materials:
 - NaturalSourcing: Simple household-level extraction/refinement from natural sources
 - OpenSourceLocalSourcing: More complex processes using open-source tools/designs
 - CommercialSourcing: Purchasing from vendors (NOT mutually exclusive with above)
+- CommercialSourcingTable: Columnar mirror of CommercialSourcing for catalog queries
 
 Note: CommercialSourcing can overlap with NaturalSourcing or OpenSourceLocalSourcing.
 A vendor may use natural or open-source methods to produce what they sell commercially.
@@ -30,11 +31,15 @@ Use isCommercialOnly=True for vendors with proprietary-only production methods.
 from polariMaterialsScienceModule.materialSourcing.materialSourcing import MaterialSourcing
 from polariMaterialsScienceModule.materialSourcing.naturalSourcing import NaturalSourcing
 from polariMaterialsScienceModule.materialSourcing.openSourceLocalSourcing import OpenSourceLocalSourcing
-from polariMaterialsScienceModule.materialSourcing.commercialSourcing import CommercialSourcing
+from polariMaterialsScienceModule.materialSourcing.commercialSourcing import CommercialSourcing, FrozenCommercialSourcing, SourcingFeature
+from polariMaterialsScienceModule.materialSourcing.commercialSourcingTable import CommercialSourcingTable
 
 __all__ = [
     'MaterialSourcing',
     'NaturalSourcing',
     'OpenSourceLocalSourcing',
-    'CommercialSourcing'
+    'CommercialSourcing',
+    'FrozenCommercialSourcing',
+    'SourcingFeature',
+    'CommercialSourcingTable'
 ]
@@ -24,11 +24,31 @@ or open-source methods and sell them commercially. This class focuses on
 the purchasing relationship and vendor details.
 """
 
+from collections import namedtuple
+from enum import IntFlag
+
 from objectTreeDecorators import treeObjectInit
+from polariMaterialsScienceModule.featureFlags import FeatureFlagsMixin
+from polariMaterialsScienceModule.fieldValues import intern_value
 from polariMaterialsScienceModule.materialSourcing.materialSourcing import MaterialSourcing
 
 
-class CommercialSourcing(MaterialSourcing):
+class SourcingFeature(IntFlag):
+    """Bit flags for commercial sourcing boolean fields (see featureFlags)."""
+    LOCALLY_AVAILABLE = 1
+    RENEWABLE_SOURCE = 2
+    COMMERCIAL_ONLY = 4
+    BULK_DISCOUNT = 8
+    LOCAL_PICKUP = 16
+    BATCH_CERTIFICATES = 32
+    RETURNS_ACCEPTED = 64
+    ACCOUNT_REQUIRED = 128
+    ETHICAL_SOURCING = 256
+    LOCAL_BUSINESS = 512
+    SUPPORTS_COMMUNITY = 1024
+
+
+class CommercialSourcing(FeatureFlagsMixin, MaterialSourcing):
     """
     Commercial purchasing from vendors.
 
@@ -106,6 +126,37 @@ class CommercialSourcing(MaterialSourcing):
 
     SOURCING_TYPE = 'commercial'
 
+    IDENTITY_FIELDS = ('rawMaterialId', 'vendorName', 'productCode')
+
+    # (boolean field, flag) pairs folded into featureFlags.
+    FEATURE_FIELDS = (
+        ('locallyAvailable', SourcingFeature.LOCALLY_AVAILABLE),
+        ('renewableSource', SourcingFeature.RENEWABLE_SOURCE),
+        ('isCommercialOnly', SourcingFeature.COMMERCIAL_ONLY),
+        ('bulkDiscountAvailable', SourcingFeature.BULK_DISCOUNT),
+        ('localPickupAvailable', SourcingFeature.LOCAL_PICKUP),
+        ('batchCertificates', SourcingFeature.BATCH_CERTIFICATES),
+        ('returnsAccepted', SourcingFeature.RETURNS_ACCEPTED),
+        ('accountRequired', SourcingFeature.ACCOUNT_REQUIRED),
+        ('ethicalSourcing', SourcingFeature.ETHICAL_SOURCING),
+        ('localBusiness', SourcingFeature.LOCAL_BUSINESS),
+        ('supportsCommunity', SourcingFeature.SUPPORTS_COMMUNITY),
+    )
+
+    SOURCING_FIELDS = MaterialSourcing.SOURCING_FIELDS + (
+        'vendorName', 'vendorType', 'vendorContact', 'vendorWebsite', 'vendorLocation',
+        'isCommercialOnly', 'productionMethod', 'naturalSourcingId',
+        'openSourceSourcingId', 'productionTransparency',
+        'productName', 'productCode', 'productGrade', 'technicalDataSheet', 'safetyDataSheet',
+        'pricePerUnit', 'priceUnit', 'priceCurrency', 'bulkDiscountAvailable', 'bulkPricing',
+        'orderingMethod', 'minimumOrder', 'minimumOrderOrderUnit', 'shippingOptions',
+        'typicalLeadTime', 'localPickupAvailable',
+        'stockReliability', 'supplyChainRisk', 'alternativeVendors',
+        'qualityConsistencyRating', 'batchCertificates', 'returnsAccepted', 'qualityGuarantee',
+        'accountRequired', 'relationshipType', 'supportQuality',
+        'ethicalSourcing', 'sustainabilityCertifications', 'localBusiness', 'supportsCommunity',
+    )
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -197,17 +248,17 @@ class CommercialSourcing(MaterialSourcing):
 
         # Vendor information
         self.vendorName = vendorName
-        self.vendorType = vendorType
+        self.vendorType = intern_value(vendorType)
         self.vendorContact = vendorContact
         self.vendorWebsite = vendorWebsite
         self.vendorLocation = vendorLocation
 
         # Production method
         self.isCommercialOnly = isCommercialOnly
-        self.productionMethod = productionMethod
+        self.productionMethod = intern_value(productionMethod)
         self.naturalSourcingId = naturalSourcingId
         self.openSourceSourcingId = openSourceSourcingId
-        self.productionTransparency = productionTransparency
+        self.productionTransparency = intern_value(productionTransparency)
 
         # Product information
         self.productName = productName
@@ -218,34 +269,34 @@ class CommercialSourcing(MaterialSourcing):
 
         # Pricing
         self.pricePerUnit = pricePerUnit
-        self.priceUnit = priceUnit
-        self.priceCurrency = priceCurrency
+        self.priceUnit = intern_value(priceUnit)
+        self.priceCurrency = intern_value(priceCurrency)
         self.bulkDiscountAvailable = bulkDiscountAvailable
         self.bulkPricing = bulkPricing
 
         # Ordering
-        self.orderingMethod = orderingMethod
+        self.orderingMethod = intern_value(orderingMethod)
         self.minimumOrder = minimumOrder
-        self.minimumOrderOrderUnit = minimumOrderOrderUnit
+        self.minimumOrderOrderUnit = intern_value(minimumOrderOrderUnit)
         self.shippingOptions = shippingOptions
         self.typicalLeadTime = typicalLeadTime
         self.localPickupAvailable = localPickupAvailable
 
         # Supply reliability
-        self.stockReliability = stockReliability
-        self.supplyChainRisk = supplyChainRisk
+        self.stockReliability = intern_value(stockReliability)
+        self.supplyChainRisk = intern_value(supplyChainRisk)
         self.alternativeVendors = alternativeVendors
 
         # Quality
-        self.qualityConsistencyRating = qualityConsistencyRating
+        self.qualityConsistencyRating = intern_value(qualityConsistencyRating)
         self.batchCertificates = batchCertificates
         self.returnsAccepted = returnsAccepted
         self.qualityGuarantee = qualityGuarantee
 
         # Vendor relationship
         self.accountRequired = accountRequired
-        self.relationshipType = relationshipType
-        self.supportQuality = supportQuality
+        self.relationshipType = intern_value(relationshipType)
+        self.supportQuality = intern_value(supportQuality)
 
         # Ethics/sustainability
         self.ethicalSourcing = ethicalSourcing
@@ -253,5 +304,19 @@ class CommercialSourcing(MaterialSourcing):
         self.localBusiness = localBusiness
         self.supportsCommunity = supportsCommunity
 
+    def freeze(self):
+        """
+        Return an immutable FrozenCommercialSourcing snapshot of this record.
+
+        The snapshot is a plain namedtuple with one field per entry in
+        SOURCING_FIELDS. It is detached from the object tree and does not
+        follow later edits, which suits read-only analytics and pickling
+        large batches.
+        """
+        return FrozenCommercialSourcing._make([getattr(self, name) for name in self.SOURCING_FIELDS])
+
     def __repr__(self):
         return f"CommercialSourcing(id='{self.id}', vendor='{self.vendorName}', method='{self.productionMethod}')"
+
+
+FrozenCommercialSourcing = namedtuple('FrozenCommercialSourcing', CommercialSourcing.SOURCING_FIELDS)
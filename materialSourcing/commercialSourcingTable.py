@@ -0,0 +1,268 @@
+#    Copyright (C) 2020  Dustin Etts
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+CommercialSourcingTable
+
+Columnar mirror of CommercialSourcing records for catalog-wide queries
+(cheapest vendor for a material, vendors in a region, average price).
+Prices and quantities are packed float32 columns and boolean fields are
+packed into one featureFlags column, so a filter scans packed values
+instead of loading attributes from each sourcing object. Records
+imported from JSON can be loaded straight into the table and only become
+CommercialSourcing objects when a row is requested.
+"""
+
+import json
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from polariMaterialsScienceModule.columnarTable import ColumnarTable
+from polariMaterialsScienceModule.featureFlags import pack_feature_flags
+from polariMaterialsScienceModule.materialSourcing.commercialSourcing import CommercialSourcing
+
+
+class CommercialSourcingTable(ColumnarTable):
+    """
+    Columnar table of commercial sourcing options.
+
+    Synchronised explicitly like DeviceCatalog: call add() for new or
+    loaded sourcing records and again after editing one.
+
+    Attributes:
+        sourcings: CommercialSourcing objects in row order (None for rows
+            appended from plain records until sourcing() is called)
+        records: The source record dict of each row appended from a plain
+            record, kept until sourcing() builds its object (None otherwise)
+        rowIndex: Mapping of sourcing ID -> row index
+        materialRows: Mapping of rawMaterialId -> row indices
+    """
+
+    FIELDS = (
+        ('id', None),
+        ('rawMaterialId', None),
+        ('vendorName', None),
+        ('vendorType', None),
+        ('availability', None),
+        ('sustainabilityRating', None),
+        ('geographicRegion', None),
+        ('stockReliability', None),
+        ('supplyChainRisk', None),
+        ('priceUnit', None),
+        ('priceCurrency', None),
+        ('pricePerUnit', 'f'),
+        ('estimatedCostPerUnit', 'f'),
+        ('minimumOrder', 'f'),
+        ('minimumOrderQuantity', 'f'),
+        # Lead times are free-form ints on CommercialSourcing, so int32
+        # rather than a narrower type that would reject long lead times.
+        ('leadTime', 'i'),
+        ('typicalLeadTime', 'i'),
+        ('featureFlags', 'H'),
+    )
+
+    def __init__(self, sourcings=()):
+        ColumnarTable.__init__(self, self.FIELDS)
+        self.sourcings = []
+        self.records = []
+        self.rowIndex = {}
+        self.materialRows = {}
+        for sourcing in sourcings:
+            self.add(sourcing)
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a table from plain record dicts without constructing sourcings.
+
+        Keys match the CommercialSourcing __init__ kwargs. Only the table's
+        columns are used for queries, but each record is kept whole so
+        sourcing() can build an exact object from it.
+        """
+        table = cls()
+        table.extend(records)
+        return table
+
+    @classmethod
+    def from_json(cls, filepath):
+        """Build a table from a JSON array of sourcing records."""
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        return cls.from_records(orjson.loads(data) if orjson is not None else json.loads(data))
+
+    @classmethod
+    def from_jsonl(cls, filepath):
+        """Build a table from a JSON Lines file, one sourcing record per line."""
+        loads = orjson.loads if orjson is not None else json.loads
+        table = cls()
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    table.append(loads(line))
+        return table
+
+    def add(self, sourcing):
+        """Add a sourcing record (or refresh it if already present). Returns its row index."""
+        record = {name: getattr(sourcing, name, None) for name, _ in self.fields}
+        row = self.rowIndex.get(sourcing.id)
+        if row is not None:
+            previous = self.columns['rawMaterialId'][row]
+            # Write the row first: set_row() is all-or-nothing, so the index
+            # only moves once the new values are stored.
+            self.set_row(row, record)
+            if previous != record['rawMaterialId']:
+                self.materialRows[previous].remove(row)
+                self.materialRows.setdefault(record['rawMaterialId'], []).append(row)
+            self.sourcings[row] = sourcing
+            self.records[row] = None
+            return row
+        row = ColumnarTable.append(self, record)
+        self.sourcings.append(sourcing)
+        self.records.append(None)
+        if sourcing.id is not None:
+            self.rowIndex[sourcing.id] = row
+        self.materialRows.setdefault(record['rawMaterialId'], []).append(row)
+        return row
+
+    def append(self, record):
+        """
+        Append a plain record dict with no backing sourcing object.
+
+        Boolean fields named in CommercialSourcing.FEATURE_FIELDS are packed
+        into featureFlags unless the record already carries it. A record
+        whose id is already in the table refreshes that row, as add() does,
+        and replaces any sourcing object built for it. Returns the row index.
+        """
+        source = record
+        if 'featureFlags' not in record:
+            record = dict(record, featureFlags=pack_feature_flags(
+                CommercialSourcing.FEATURE_FIELDS, record.get))
+        row = self.rowIndex.get(record.get('id'))
+        if row is not None:
+            previous = self.columns['rawMaterialId'][row]
+            self.set_row(row, {name: record.get(name) for name, _ in self.fields})
+            if previous != record.get('rawMaterialId'):
+                self.materialRows[previous].remove(row)
+                self.materialRows.setdefault(record.get('rawMaterialId'), []).append(row)
+            self.sourcings[row] = None
+            self.records[row] = source
+            return row
+        row = ColumnarTable.append(self, record)
+        self.sourcings.append(None)
+        self.records.append(source)
+        if record.get('id') is not None:
+            self.rowIndex[record['id']] = row
+        self.materialRows.setdefault(record.get('rawMaterialId'), []).append(row)
+        return row
+
+    def sourcing(self, index, manager=None):
+        """
+        Return the CommercialSourcing for a row, constructing it on first use.
+
+        Rows appended from plain records have no object until requested.
+        The object is built from the row's original record, not the packed
+        columns, so float values and fields without a column come back
+        exactly as loaded. The constructed sourcing (registered with
+        manager) is kept for later calls and replaces the stored record.
+        """
+        sourcing = self.sourcings[index]
+        if sourcing is None:
+            record = dict(self.records[index])
+            # A record carrying featureFlags instead of the boolean fields
+            # is unpacked; booleans present in the record take precedence.
+            flags = record.pop('featureFlags', None)
+            if flags is not None:
+                for field, flag in CommercialSourcing.FEATURE_FIELDS:
+                    record.setdefault(field, bool(flags & flag))
+            sourcing = self.sourcings[index] = CommercialSourcing(manager=manager, **record)
+            self.records[index] = None
+        return sourcing
+
+    def to_objects(self, manager=None):
+        """Return a CommercialSourcing for every row (see sourcing())."""
+        return [self.sourcing(index, manager) for index in range(self.rowCount)]
+
+    def filter(self, **criteria):
+        """
+        Return the sourcing objects matching every criterion.
+
+        Criteria follow ColumnarTable.where(): exact values, or inclusive
+        (low, high) ranges for numeric columns.
+
+        Example:
+            table.filter(availability='rare', pricePerUnit=(None, 20.0))
+        """
+        return [self.sourcing(row) for row in self.where(**criteria)]
+
+    def with_features(self, flags):
+        """
+        Return the sourcing objects with every SourcingFeature in flags set.
+
+        Example:
+            table.with_features(SourcingFeature.LOCAL_PICKUP | SourcingFeature.RETURNS_ACCEPTED)
+        """
+        return [self.sourcing(row) for row in self.where_flags('featureFlags', flags)]
+
+    def cheapest(self, rawMaterialId, **criteria):
+        """
+        Return the lowest-priced sourcing for a raw material, or None.
+
+        Rows without a price (pricePerUnit of 0) are skipped. Extra
+        criteria narrow the candidates as in filter(); prices are compared
+        as stored, so candidates should share a priceUnit and priceCurrency.
+        """
+        rows = self.materialRows.get(rawMaterialId, ())
+        if criteria:
+            matching = set(self.where(**criteria))
+            rows = [row for row in rows if row in matching]
+        prices = self.columns['pricePerUnit']
+        priced = [row for row in rows if prices[row] > 0]
+        if not priced:
+            return None
+        if numpy is not None:
+            best = priced[int(numpy.argmin(self.column('pricePerUnit')[priced]))]
+        else:
+            best = min(priced, key=prices.__getitem__)
+        return self.sourcing(best)
+
+    def total(self, name, rows=None):
+        """Return the sum of a numeric column over rows (all rows by default)."""
+        values = self.column(name)
+        if numpy is not None:
+            return float(values.sum(dtype='d') if rows is None else values[list(rows)].sum(dtype='d'))
+        if rows is None:
+            return float(sum(values))
+        return float(sum(values[row] for row in rows))
+
+    def mean_price(self, rows=None):
+        """Return the mean non-zero pricePerUnit over rows (all rows by default)."""
+        prices = self.columns['pricePerUnit']
+        if rows is None:
+            rows = range(self.rowCount)
+        priced = [prices[row] for row in rows if prices[row] > 0]
+        if not priced:
+            return 0.0
+        return float(sum(priced) / len(priced))
+
+    def __repr__(self):
+        return f"CommercialSourcingTable(sourcings={self.rowCount})"
@@ -28,7 +28,10 @@ Sourcing Types (by production method complexity):
   (NOT exclusive - vendors may use natural or open-source methods)
 """
 
+import weakref
+
 from objectTreeDecorators import treeObject, treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 
 
 class MaterialSourcing(treeObject):
@@ -77,6 +80,48 @@ class MaterialSourcing(treeObject):
 
     SOURCING_TYPE = 'base'
 
+    SOURCING_TYPES = frozenset({'natural', 'open_source_local', 'commercial'})
+
+    # Stored data fields in constructor order; subclasses extend this with
+    # their own fields. Used to build tuple-backed snapshots (see freeze()).
+    SOURCING_FIELDS = (
+        'id', 'rawMaterialId', 'sourcingType', 'name', 'description',
+        'availability', 'leadTime', 'minimumOrderQuantity', 'minimumOrderUnit',
+        'estimatedCostPerUnit', 'costUnit', 'costCurrency', 'geographicRegion',
+        'locallyAvailable', 'sustainabilityRating', 'renewableSource',
+        'carbonFootprint', 'qualityConsistency', 'certifications', 'notes',
+    )
+
+    # Fields that identify a shared sourcing record for get_or_create();
+    # subclasses name the fields that distinguish their own records.
+    IDENTITY_FIELDS = ('rawMaterialId', 'name')
+
+    # Live shared sourcing records keyed by (class, manager, identity
+    # values), used by get_or_create(). Held weakly so unused records can
+    # be freed.
+    _sharedSourcings = weakref.WeakValueDictionary()
+
+    # SOURCING_TYPE -> class, filled in by __init_subclass__.
+    _sourcingClasses = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Validated once per class; instances never re-check their type.
+        if 'SOURCING_TYPE' in cls.__dict__:
+            if cls.SOURCING_TYPE not in MaterialSourcing.SOURCING_TYPES:
+                raise ValueError(
+                    f"{cls.__name__}.SOURCING_TYPE '{cls.SOURCING_TYPE}' is not one of "
+                    f"{sorted(MaterialSourcing.SOURCING_TYPES)}")
+            MaterialSourcing._sourcingClasses[cls.SOURCING_TYPE] = cls
+
+    @staticmethod
+    def sourcing_class(sourcingType):
+        """Return the MaterialSourcing subclass registered for a sourcingType."""
+        cls = MaterialSourcing._sourcingClasses.get(sourcingType)
+        if cls is None:
+            raise ValueError(f"Unknown sourcing type '{sourcingType}'")
+        return cls
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -108,37 +153,71 @@ class MaterialSourcing(treeObject):
                  # Notes
                  notes=''):
         treeObject.__init__(self, manager=manager, branch=branch, id=id)
-        self.rawMaterialId = rawMaterialId
-        self.sourcingType = sourcingType
+        self.rawMaterialId = intern_value(rawMaterialId)
+        self.sourcingType = intern_value(sourcingType)
         self.name = name
         self.description = description
 
         # Availability
-        self.availability = availability
+        self.availability = intern_value(availability)
         self.leadTime = leadTime
         self.minimumOrderQuantity = minimumOrderQuantity
-        self.minimumOrderUnit = minimumOrderUnit
+        self.minimumOrderUnit = intern_value(minimumOrderUnit)
 
         # Cost
         self.estimatedCostPerUnit = estimatedCostPerUnit
-        self.costUnit = costUnit
-        self.costCurrency = costCurrency
+        self.costUnit = intern_value(costUnit)
+        self.costCurrency = intern_value(costCurrency)
 
         # Location
-        self.geographicRegion = geographicRegion
+        self.geographicRegion = intern_value(geographicRegion)
         self.locallyAvailable = locallyAvailable
 
         # Sustainability
-        self.sustainabilityRating = sustainabilityRating
+        self.sustainabilityRating = intern_value(sustainabilityRating)
         self.renewableSource = renewableSource
         self.carbonFootprint = carbonFootprint
 
         # Quality
-        self.qualityConsistency = qualityConsistency
+        self.qualityConsistency = intern_value(qualityConsistency)
         self.certifications = certifications
 
         # Notes
         self.notes = notes
 
+    @classmethod
+    def get_or_create(cls, manager=None, **fields):
+        """
+        Return a shared sourcing record, creating it if needed.
+
+        Bulk imports often repeat identical sourcing records. Records are
+        identified by the class, the manager and the IDENTITY_FIELDS values
+        (which must be hashable); a live record with that identity is
+        reused only if it matches every given field, otherwise a new,
+        unshared record is constructed. Calls that give none of the
+        identity fields always construct a new record. Use the constructor
+        instead when a specific id must be kept or the record will be
+        edited independently.
+
+        Args:
+            manager: The object tree manager for a newly created record.
+            **fields: Constructor fields.
+
+        Returns:
+            The existing or newly created sourcing record.
+        """
+        identity = tuple(fields.get(name, '') for name in cls.IDENTITY_FIELDS)
+        if not any(identity):
+            return cls(manager=manager, **fields)
+        key = (cls, manager) + identity
+        sourcing = cls._sharedSourcings.get(key)
+        if sourcing is not None and all(
+                getattr(sourcing, name) == value for name, value in fields.items()):
+            return sourcing
+        sourcing = cls(manager=manager, **fields)
+        if key not in cls._sharedSourcings:
+            cls._sharedSourcings[key] = sourcing
+        return sourcing
+
     def __repr__(self):
         return f"MaterialSourcing(id='{self.id}', name='{self.name}', type='{self.sourcingType}')"
@@ -24,6 +24,7 @@ and simple, safe steps to follow.
 """
 
 from objectTreeDecorators import treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 from polariMaterialsScienceModule.materialSourcing.materialSourcing import MaterialSourcing
 
 
@@ -85,6 +86,8 @@ class NaturalSourcing(MaterialSourcing):
 
     SOURCING_TYPE = 'natural'
 
+    IDENTITY_FIELDS = ('rawMaterialId', 'sourceName', 'sourcePart')
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -158,15 +161,15 @@ class NaturalSourcing(MaterialSourcing):
             certifications=certifications, notes=notes)
 
         # Natural source
-        self.sourceType = sourceType
+        self.sourceType = intern_value(sourceType)
         self.sourceName = sourceName
-        self.sourcePart = sourcePart
-        self.sourceAvailability = sourceAvailability
+        self.sourcePart = intern_value(sourcePart)
+        self.sourceAvailability = intern_value(sourceAvailability)
 
         # Household process
         self.processDescription = processDescription
         self.processSteps = processSteps
-        self.processDifficulty = processDifficulty
+        self.processDifficulty = intern_value(processDifficulty)
         self.estimatedTime = estimatedTime
 
         # Equipment needed
@@ -177,10 +180,10 @@ class NaturalSourcing(MaterialSourcing):
         # Consumables/inputs
         self.inputMaterials = inputMaterials
         self.inputMaterialsSafe = inputMaterialsSafe
-        self.inputMaterialsAvailability = inputMaterialsAvailability
+        self.inputMaterialsAvailability = intern_value(inputMaterialsAvailability)
 
         # Safety
-        self.safetyLevel = safetyLevel
+        self.safetyLevel = intern_value(safetyLevel)
         self.safetyNotes = safetyNotes
         self.childSafe = childSafe
         self.indoorSafe = indoorSafe
@@ -188,8 +191,8 @@ class NaturalSourcing(MaterialSourcing):
 
         # Yield
         self.typicalYield = typicalYield
-        self.yieldUnit = yieldUnit
-        self.yieldVariability = yieldVariability
+        self.yieldUnit = intern_value(yieldUnit)
+        self.yieldVariability = intern_value(yieldVariability)
 
         # Seasonality
         self.seasonal = seasonal
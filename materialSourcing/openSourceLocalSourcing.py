@@ -24,6 +24,7 @@ with readily available open-source equipment/designs you can build or acquire.
 """
 
 from objectTreeDecorators import treeObjectInit
+from polariMaterialsScienceModule.fieldValues import intern_value
 from polariMaterialsScienceModule.materialSourcing.materialSourcing import MaterialSourcing
 
 
@@ -96,6 +97,8 @@ class OpenSourceLocalSourcing(MaterialSourcing):
 
     SOURCING_TYPE = 'open_source_local'
 
+    IDENTITY_FIELDS = ('rawMaterialId', 'projectName')
+
     @treeObjectInit
     def __init__(self,
                  manager=None,
@@ -181,14 +184,14 @@ class OpenSourceLocalSourcing(MaterialSourcing):
         # Open source resources
         self.projectName = projectName
         self.projectUrl = projectUrl
-        self.projectLicense = projectLicense
-        self.documentationQuality = documentationQuality
+        self.projectLicense = intern_value(projectLicense)
+        self.documentationQuality = intern_value(documentationQuality)
         self.communityActive = communityActive
         self.communityUrl = communityUrl
 
         # Equipment/tools required
         self.equipmentDesigns = equipmentDesigns
-        self.equipmentBuildDifficulty = equipmentBuildDifficulty
+        self.equipmentBuildDifficulty = intern_value(equipmentBuildDifficulty)
         self.equipmentBuildTime = equipmentBuildTime
         self.equipmentBuildCost = equipmentBuildCost
         self.prebuiltAvailable = prebuiltAvailable
@@ -196,11 +199,11 @@ class OpenSourceLocalSourcing(MaterialSourcing):
 
         # Skills required
         self.skillsRequired = skillsRequired
-        self.skillLevel = skillLevel
+        self.skillLevel = intern_value(skillLevel)
         self.trainingResources = trainingResources
 
         # Process complexity
-        self.processComplexity = processComplexity
+        self.processComplexity = intern_value(processComplexity)
         self.processSteps = processSteps
         self.estimatedSetupTime = estimatedSetupTime
         self.estimatedProductionTime = estimatedProductionTime
@@ -212,15 +215,15 @@ class OpenSourceLocalSourcing(MaterialSourcing):
 
         # Safety and requirements
         self.safetyRequirements = safetyRequirements
-        self.spaceRequired = spaceRequired
+        self.spaceRequired = intern_value(spaceRequired)
         self.powerRequirements = powerRequirements
         self.ventilationRequirements = ventilationRequirements
         self.wasteHandling = wasteHandling
 
         # Quality and yield
         self.typicalYield = typicalYield
-        self.yieldUnit = yieldUnit
-        self.qualityAchievable = qualityAchievable
+        self.yieldUnit = intern_value(yieldUnit)
+        self.qualityAchievable = intern_value(qualityAchievable)
         self.qualityControlMethods = qualityControlMethods
 
         # Iteration and improvement
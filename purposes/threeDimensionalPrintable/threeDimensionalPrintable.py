@@ -45,10 +45,44 @@ considered when evaluating whether a material can be 3D printed:
 - MeltFlowIndex: Quantifies extrusion behavior at temperature
 """
 
+from functools import lru_cache
+
 from objectTreeDecorators import treeObjectInit
 from polariMaterialsScienceModule.purposes.purposeCategory import PurposeCategory
 
 
+@lru_cache(maxsize=4096)
+def fdm_constraint_failures(nozzleTempMin, bedTempRequired, filamentDiameter,
+                            enclosureRequired, hotendType, abrasiveResistanceRequired,
+                            deviceNozzleTempMax, deviceBedTempMax, deviceFilamentDiameter,
+                            deviceHasEnclosure, deviceHotendType, deviceHasHardenedNozzle):
+    """
+    Return the FDM hard constraints a material fails on a device.
+
+    A pure function of the scalar requirements and device capabilities,
+    memoized because the same material/printer pairs are re-checked
+    repeatedly. Zero or empty values are treated as unspecified and
+    never fail.
+
+    Returns:
+        tuple: Names of the failed constraints; empty if printable.
+    """
+    failures = []
+    if nozzleTempMin and deviceNozzleTempMax and nozzleTempMin > deviceNozzleTempMax:
+        failures.append('nozzle_temperature')
+    if bedTempRequired and deviceBedTempMax is not None and bedTempRequired > deviceBedTempMax:
+        failures.append('bed_temperature')
+    if filamentDiameter and deviceFilamentDiameter and abs(filamentDiameter - deviceFilamentDiameter) > 0.01:
+        failures.append('filament_diameter')
+    if enclosureRequired and not deviceHasEnclosure:
+        failures.append('enclosure')
+    if hotendType == 'all-metal' and deviceHotendType == 'ptfe-lined':
+        failures.append('hotend_type')
+    if abrasiveResistanceRequired and not deviceHasHardenedNozzle:
+        failures.append('hardened_nozzle')
+    return tuple(failures)
+
+
 class ThreeDimensionalPrintable(PurposeCategory):
     """
     Base printability definition for a material with a specific device.
@@ -246,5 +280,34 @@ class ThreeDimensionalPrintable(PurposeCategory):
         self.limitingFactors = limitingFactors
         self.notes = notes
 
+    def constraint_failures(self, printer=None):
+        """
+        Return the FDM hard constraints this material fails.
+
+        Args:
+            printer: An FDMPrinter to check against. If omitted, the
+                device* fields recorded on this object are used.
+
+        Returns:
+            tuple: Names of the failed constraints; empty if printable.
+        """
+        if printer is None:
+            deviceSpecs = (self.deviceNozzleTempMax, self.deviceBedTempMax or None,
+                           self.deviceFilamentDiameter, self.deviceHasEnclosure,
+                           self.deviceHotendType, self.deviceHasHardenedNozzle)
+        else:
+            deviceSpecs = (printer.hotendTempMax,
+                           printer.bedTempMax if printer.hasHeatedBed else 0.0,
+                           printer.filamentDiameter, printer.hasEnclosure,
+                           printer.hotendType, printer.hasHardenedNozzle)
+        return fdm_constraint_failures(
+            self.nozzleTempMin, self.bedTempRequired, self.filamentDiameter,
+            self.enclosureRequired, self.hotendType, self.abrasiveResistanceRequired,
+            *deviceSpecs)
+
+    def is_printable_with(self, printer):
+        """Check whether an FDMPrinter meets every FDM hard constraint."""
+        return not self.constraint_failures(printer)
+
     def __repr__(self):
         return f"ThreeDimensionalPrintable(id='{self.id}', materialId='{self.materialId}', device='{self.deviceName}', printable={self.isPrintable})"
@@ -21,20 +21,61 @@ property definitions in the Polari framework.
 """
 
 
-def register_materials_science_defaults(manager=None):
+import weakref
+from functools import lru_cache
+
+# Managers that have already had the defaults registered. Held weakly so
+# registering does not keep a manager alive.
+_registered_managers = weakref.WeakSet()
+
+
+def register_materials_science_defaults(manager=None, force=False):
     """
     Register default materials science classes with the given manager.
 
     This function should be called during application initialization to
     register all material science models with the object tree manager.
+    Repeated calls for the same manager are no-ops unless force is set.
 
     Args:
         manager: The object tree manager to register defaults with.
                  If None, defaults are registered globally.
+        force: If True, register with the manager even if it has
+               already been registered.
 
     Returns:
         dict: A dictionary of registered class names to class objects
     """
+    registered_classes = dict(_build_registered_classes())
+
+    # If a manager is provided, register with it
+    if manager is not None and hasattr(manager, 'register_class'):
+        if force or not _is_registered(manager):
+            for class_name, class_obj in registered_classes.items():
+                manager.register_class(class_name, class_obj)
+            _mark_registered(manager)
+
+    return registered_classes
+
+
+def _is_registered(manager):
+    try:
+        return manager in _registered_managers
+    except TypeError:
+        # Managers that cannot be weakly referenced are never cached.
+        return False
+
+
+def _mark_registered(manager):
+    try:
+        _registered_managers.add(manager)
+    except TypeError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _build_registered_classes():
+    """Import every module class once and return the name -> class map."""
     # Import core classes
     from polariMaterialsScienceModule.material import Material
     from polariMaterialsScienceModule.materialProperty import MaterialProperty
@@ -322,10 +363,4 @@ def register_materials_science_defaults(manager=None):
         'FormulationIntent': FormulationIntent
     }
 
-    # If a manager is provided, register with it
-    if manager is not None:
-        for class_name, class_obj in registered_classes.items():
-            if hasattr(manager, 'register_class'):
-                manager.register_class(class_name, class_obj)
-
     return registered_classes
@@ -62,8 +62,6 @@ class AtomisticResolution(ResolutionCategory):
                                     categoryDescription=categoryDescription,
                                     scaleRange='Å-nm',
                                     typicalMethods='MD, LAMMPS, GROMACS, NAMD')
-        self.resolutionLevel = self.RESOLUTION_LEVEL
-        self.resolutionCategory = self.RESOLUTION_CATEGORY
 
     def __repr__(self):
         return f"AtomisticResolution(id='{self.id}', materialId='{self.materialId}')"
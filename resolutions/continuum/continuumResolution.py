@@ -65,8 +65,6 @@ class ContinuumResolution(ResolutionCategory):
                                     categoryDescription=categoryDescription,
                                     scaleRange='µm-mm',
                                     typicalMethods='FEM, FEA, structural analysis')
-        self.resolutionLevel = self.RESOLUTION_LEVEL
-        self.resolutionCategory = self.RESOLUTION_CATEGORY
 
     def __repr__(self):
         return f"ContinuumResolution(id='{self.id}', materialId='{self.materialId}')"
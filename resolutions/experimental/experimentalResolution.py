@@ -63,8 +63,6 @@ class ExperimentalResolution(ResolutionCategory):
                                     categoryDescription=categoryDescription,
                                     scaleRange='mm-m',
                                     typicalMethods='Physical testing, ASTM/ISO standards')
-        self.resolutionLevel = self.RESOLUTION_LEVEL
-        self.resolutionCategory = self.RESOLUTION_CATEGORY
 
     def __repr__(self):
         return f"ExperimentalResolution(id='{self.id}', materialId='{self.materialId}')"
@@ -62,8 +62,6 @@ class MesoscaleResolution(ResolutionCategory):
                                     categoryDescription=categoryDescription,
                                     scaleRange='nm-µm',
                                     typicalMethods='CGMD, Martini, DPD')
-        self.resolutionLevel = self.RESOLUTION_LEVEL
-        self.resolutionCategory = self.RESOLUTION_CATEGORY
 
     def __repr__(self):
         return f"MesoscaleResolution(id='{self.id}', materialId='{self.materialId}')"
@@ -62,8 +62,6 @@ class QuantumResolution(ResolutionCategory):
                                     categoryDescription=categoryDescription,
                                     scaleRange='Å',
                                     typicalMethods='DFT, VASP, Gaussian, QE')
-        self.resolutionLevel = self.RESOLUTION_LEVEL
-        self.resolutionCategory = self.RESOLUTION_CATEGORY
 
     def __repr__(self):
         return f"QuantumResolution(id='{self.id}', materialId='{self.materialId}')"
@@ -23,6 +23,20 @@ and instantiates them as treeObject instances in the object tree.
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_records(filepath):
+    """Read a JSON array of records, using orjson when it is installed."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def seed_initial_data(manager=None):
     """
@@ -84,13 +98,7 @@ def seed_initial_data(manager=None):
         filepath = os.path.join(data_dir, filename)
         if not os.path.exists(filepath):
             continue
-        with open(filepath, 'r') as f:
-            records = json.load(f)
-        instances = []
-        for record in records:
-            record['manager'] = manager
-            obj = cls(**record)
-            instances.append(obj)
-        created[cls.__name__] = instances
+        records = _load_records(filepath)
+        created[cls.__name__] = [cls(**{**record, 'manager': manager}) for record in records]
 
     return created
@@ -0,0 +1,43 @@
+"""ColumnarTable keeps its columns aligned when a value cannot be stored."""
+
+import pytest
+
+from polariMaterialsScienceModule.columnarTable import ColumnarTable
+
+
+FIELDS = (('id', None), ('price', 'f'), ('leadTime', 'H'), ('flags', 'B'))
+
+
+def column_lengths(table):
+    return {name: len(column) for name, column in table.columns.items()}
+
+
+def test_append_rolls_back_on_overflow():
+    table = ColumnarTable(FIELDS)
+    with pytest.raises(ValueError, match="leadTime"):
+        table.append({'id': 'bad', 'price': 1.0, 'leadTime': 70000, 'flags': 1})
+    assert table.rowCount == 0
+    assert set(column_lengths(table).values()) == {0}
+
+    row = table.append({'id': 'good', 'price': 2.0, 'leadTime': 2, 'flags': 3})
+    assert row == 0
+    assert table.row(0) == {'id': 'good', 'price': 2.0, 'leadTime': 2, 'flags': 3}
+    assert set(column_lengths(table).values()) == {1}
+
+
+def test_append_rolls_back_on_unconvertible_value():
+    table = ColumnarTable(FIELDS)
+    with pytest.raises(ValueError, match="price"):
+        table.append({'id': 'bad', 'price': 'n/a'})
+    assert set(column_lengths(table).values()) == {0}
+
+
+def test_set_row_is_all_or_nothing():
+    table = ColumnarTable(FIELDS)
+    table.append({'id': 'a', 'price': 1.0, 'leadTime': 5, 'flags': 1})
+    with pytest.raises(ValueError, match="leadTime"):
+        table.set_row(0, {'id': 'changed', 'price': 9.0, 'leadTime': -1})
+    assert table.row(0) == {'id': 'a', 'price': 1.0, 'leadTime': 5, 'flags': 1}
+    with pytest.raises(KeyError):
+        table.set_row(0, {'id': 'changed', 'missing': 1})
+    assert table.row(0)['id'] == 'a'
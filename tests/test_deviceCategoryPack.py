@@ -0,0 +1,45 @@
+"""DeviceCategory.pack()/unpack() round-trip catalog fields."""
+
+from polariMaterialsScienceModule.devices.cncMills.cncMill import CNCMill
+
+
+def make_mill(**fields):
+    values = dict(manufacturer='Haas', model='VF-2', axisCount=3,
+                  workEnvelopeX=762.0, spindleSpeedMax=8100, toolCapacity=20,
+                  hasCoolantSystem=True, hasRotaryTable=False,
+                  toolChangerType='atc', coolantType='flood', controllerBrand='Haas NGC')
+    values.update(fields)
+    return CNCMill(**values)
+
+
+def test_unpack_returns_packed_values():
+    record = CNCMill.unpack(make_mill().pack())
+    assert record['manufacturer'] == 'Haas'
+    assert record['model'] == 'VF-2'
+    assert record['axisCount'] == 3
+    assert record['workEnvelopeX'] == 762.0
+    assert record['spindleSpeedMax'] == 8100
+    assert record['toolCapacity'] == 20
+    assert record['hasCoolantSystem'] is True
+    assert record['hasRotaryTable'] is False
+    assert record['controllerBrand'] == 'Haas NGC'
+
+
+def test_unpacked_record_rebuilds_an_identical_device():
+    packed = make_mill().pack()
+    assert CNCMill(**CNCMill.unpack(packed)).pack() == packed
+
+
+def test_unset_and_whole_float_values_pack():
+    # A whole float in an integer field is coerced; None packs as 0 or ''.
+    record = CNCMill.unpack(make_mill(spindleSpeedMax=6000.0, spindlePower=None,
+                                      controllerBrand=None).pack())
+    assert record['spindleSpeedMax'] == 6000
+    assert record['spindlePower'] == 0.0
+    assert record['controllerBrand'] == ''
+
+
+def test_non_ascii_strings_round_trip():
+    record = CNCMill.unpack(make_mill(manufacturer='Mäder', model='Fräse 5').pack())
+    assert record['manufacturer'] == 'Mäder'
+    assert record['model'] == 'Fräse 5'
@@ -0,0 +1,62 @@
+"""FormulationComponentTable keeps its indexes in step with its columns."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from polariMaterialsScienceModule.formulation.formulationComponentTable import FormulationComponentTable
+
+
+def make_component(**fields):
+    values = dict(id='c1', formulationId='f1', materialId='m1', role='base',
+                  weightPercent=60.0, orderOfAddition=1)
+    values.update(fields)
+    return SimpleNamespace(**values)
+
+
+def test_update_leaves_index_unchanged_when_row_cannot_be_stored():
+    table = FormulationComponentTable()
+    table.add(make_component())
+    table.add(make_component(id='c2', weightPercent=40.0))
+
+    with pytest.raises(ValueError):
+        table.update(make_component(formulationId='f2', weightPercent='abc'))
+
+    assert table.formulationRows == {'f1': [0, 1]}
+    assert table.columns['formulationId'][0] == 'f1'
+    assert table.formulation_totals() == {'f1': 100.0}
+
+
+def test_update_moves_row_to_new_formulation():
+    table = FormulationComponentTable()
+    table.add(make_component())
+    table.update(make_component(formulationId='f2'))
+    assert table.formulationRows == {'f1': [], 'f2': [0]}
+    assert table.columns['formulationId'][0] == 'f2'
+
+
+def test_component_is_built_from_the_original_record():
+    table = FormulationComponentTable.from_records([{
+        'id': 'c1', 'formulationId': 'f1', 'materialId': 'm1', 'role': 'additive',
+        'weightPercent': 12.5, 'orderOfAddition': 2,
+        'roleJustification': 'why', 'mixingInstructions': 'stir',
+        'expectedPropertyEffects': 'Hardness',
+    }])
+    component = table.component(0)
+    assert component.role == 'additive'
+    assert component.roleJustification == 'why'
+    assert component.mixingInstructions == 'stir'
+    assert component.expectedPropertyEffects == 'Hardness'
+    assert table.records == [None]
+
+
+def test_append_with_known_id_refreshes_the_row():
+    table = FormulationComponentTable()
+    table.append({'id': 'c1', 'formulationId': 'f1', 'weightPercent': 60.0})
+    table.append({'id': 'c1', 'formulationId': 'f1', 'weightPercent': 60.0})
+    assert table.rowCount == 1
+    assert table.formulation_totals() == {'f1': 60.0}
+
+    table.append({'id': 'c1', 'formulationId': 'f2', 'weightPercent': 40.0})
+    assert table.rowCount == 1
+    assert table.formulation_totals() == {'f1': 0.0, 'f2': 40.0}